@@ -1,13 +1,137 @@
 import os
-import json
+import time
+import functools
+import threading
 import winreg
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Tuple
 import re
 from PySide6.QtCore import QObject, Signal
 
+from source.backend.json_io import json_loads, json_dumps, write_file_atomic, JSONDecodeError
 from source.frontend.localization import LocalizationManager
 
 CONFIG_FILE = "unreal_engines_config.json"
+# Seconds between full layout checks of the saved engines
+DEFAULT_REVALIDATE_INTERVAL = 24 * 60 * 60
+
+# Subdirectories of <root>/Engine that every installation has (lowercase)
+REQUIRED_ENGINE_DIRS = frozenset({"build", "binaries", "content", "plugins", "source"})
+
+
+def _config_int(config_data: dict, key: str, default: int) -> int:
+    """
+    Return an integer configuration value, default if it is missing or not an integer
+
+    :param config_data: Parsed configuration
+    :param key: Configuration key
+    :param default: Value used for missing, null or hand-edited values of another type
+    :return: Integer value
+    """
+    value = config_data.get(key)
+    # bool is an int subclass, but never a valid interval or timestamp
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return default
+
+
+# Numeric components of a version string such as "5.3.2" or "UE_5.3"
+_VERSION_NUMBER_RE = re.compile(r'\d+')
+
+
+def version_tuple(version: str) -> Tuple[int, ...]:
+    """
+    Return major and minor version numbers, e.g. (5, 3) for "5.3.2"
+
+    Used as a sort key so that "5.10" orders after "5.2".
+
+    :param version: Engine version string
+    :return: Tuple of up to two integers, empty if the string has no numbers
+    """
+    return tuple(map(int, _VERSION_NUMBER_RE.findall(version)[:2]))
+
+
+def _scan_entries(path: str, dirs: bool) -> Dict[str, os.DirEntry]:
+    """
+    List directory entries of one kind in a single scandir pass
+
+    :param path: Directory to scan
+    :param dirs: True to collect subdirectories, False to collect files
+    :return: Dictionary {lowercase name: entry}, empty if the directory cannot be read
+    """
+    try:
+        with os.scandir(path) as entries:
+            # Names are lowercased to keep the case-insensitive semantics of Windows paths
+            return {entry.name.lower(): entry for entry in entries
+                    if (entry.is_dir() if dirs else entry.is_file())}
+    except OSError:
+        return {}
+
+
+# Directories whose listings the layout check inspects, relative to the engine root
+_LAYOUT_DIRS = (
+    ("Engine",),
+    ("Engine", "Build", "BatchFiles"),
+    ("Engine", "Binaries", "Win64"),
+)
+
+# Engine roots found valid and the mtimes of their layout directories at that moment.
+# Only positive results are kept, so an incomplete installation is checked again next time.
+_valid_layouts: Dict[str, Tuple[int, ...]] = {}
+
+
+def _layout_mtimes(engine_path: str) -> Optional[Tuple[int, ...]]:
+    """
+    Return modification times of the directories inspected by the layout check
+
+    Adding or removing an entry in a directory changes its mtime, so the tuple
+    changes whenever the outcome of the check may change.
+
+    :param engine_path: Path to the engine root directory
+    :return: Tuple of mtimes, None if one of the directories is missing
+    """
+    try:
+        return tuple(os.stat(os.path.join(engine_path, *parts)).st_mtime_ns for parts in _LAYOUT_DIRS)
+    except OSError:
+        return None
+
+
+def _validate_engine_layout(engine_path: str) -> bool:
+    """
+    Check the engine directory layout
+
+    :param engine_path: Path to the engine root directory
+    :return: True if the layout is a valid installation, False otherwise
+    """
+    # Key directories that must be present, collected in a single directory pass
+    engine_dirs = _scan_entries(os.path.join(engine_path, "Engine"), dirs=True)
+    if not REQUIRED_ENGINE_DIRS <= engine_dirs.keys():
+        return False
+
+    # RunUAT.bat is required for building plugins
+    batch_files = _scan_entries(os.path.join(engine_dirs["build"].path, "BatchFiles"), dirs=False)
+    if "runuat.bat" not in batch_files:
+        return False
+
+    # At least one of the editor executables should exist (UnrealEditor.exe or UE4Editor.exe for UE4)
+    binaries = _scan_entries(os.path.join(engine_dirs["binaries"].path, "Win64"), dirs=False)
+    return "unrealeditor.exe" in binaries or "ue4editor.exe" in binaries
+
+
+@functools.lru_cache(maxsize=32)
+def _read_build_version(version_file: str, mtime_ns: int) -> Tuple[int, int]:
+    """
+    Read (major, minor) from a Build.version file, memoized by path and mtime
+
+    Errors are raised to the caller and therefore never cached.
+
+    :param version_file: Path to Build.version
+    :param mtime_ns: Modification time of the file, used as cache key
+    :return: Tuple (major, minor)
+    """
+    with open(version_file, 'rb') as f:
+        version_data = json_loads(f.read())
+    return version_data.get("MajorVersion", 0), version_data.get("MinorVersion", 0)
 
 
 class EngineFinderSignals(QObject):
@@ -17,6 +141,7 @@ class EngineFinderSignals(QObject):
     log_message = Signal(str, str)  # (text, type)
     finished = Signal(list)  # List of UE paths
     progress = Signal(int, int)  # (current progress, max progress)
+    engines_found = Signal(dict)  # {version: path} found by a background search
 
 
 class EngineFinder:
@@ -34,19 +159,29 @@ class EngineFinder:
         r"SOFTWARE\EpicGames",
     ]
     POSSIBLE_ENGINE_NAMES = ["Unreal", "UE_", "UE5", "UE4"]
+    _ENGINE_NAME_RE = re.compile("|".join(map(re.escape, POSSIBLE_ENGINE_NAMES)))
+    ENGINE_ENV_VARS = ("UE_ROOT", "UE5_ROOT", "UE4_ROOT", "UNREAL_ENGINE", "UNREAL_ENGINE_DIR")
 
     def __init__(self, localization: Optional[LocalizationManager] = None, config_path: Optional[str] = None) -> None:
         self.config_file = config_path or CONFIG_FILE
         self.signals = EngineFinderSignals()
         self.found_engines = {}  # Dictionary {version: path}
         self.localization = localization
+        self._log_lock = threading.Lock()
+        self._existing_standard_paths = None  # Resolved on first scan of standard paths
+        self._negative_paths = set()  # Registry keys known to be missing
+        # Saved engines are fully validated once per interval, otherwise only their root folder is checked
+        self.revalidate_interval = DEFAULT_REVALIDATE_INTERVAL
+        self.last_full_check = 0  # Unix time of the last full validation
 
     def log(self, message: str, log_type: str = "INFO") -> None:
         """
         Log method for search process
         """
-        print(f"[{log_type}] {message}")
-        self.signals.log_message.emit(message, log_type)
+        # Search methods may log from worker threads
+        with self._log_lock:
+            print(f"[{log_type}] {message}")
+            self.signals.log_message.emit(message, log_type)
 
     def is_valid_engine_path(self, engine_path: str) -> bool:
         """
@@ -55,28 +190,16 @@ class EngineFinder:
         :param engine_path: Path to check
         :return: True if valid, False otherwise
         """
-        # Basic checks for required files and directories
-        uat_path = os.path.join(engine_path, "Engine", "Build", "BatchFiles", "RunUAT.bat")
-        ue_editor_path = os.path.join(engine_path, "Engine", "Binaries", "Win64", "UnrealEditor.exe")
-        ue4_editor_path = os.path.join(engine_path, "Engine", "Binaries", "Win64", "UE4Editor.exe")  # For UE4
-
-        # Check for either UE4Editor.exe or UnrealEditor.exe
-        if not os.path.exists(uat_path):
+        # Mtimes of the inspected directories key the cache, so repeated checks cost a few stats
+        mtimes = _layout_mtimes(engine_path)
+        if mtimes is None:
             return False
-
-        # At least one of the editor executables should exist
-        has_editor = os.path.exists(ue_editor_path) or os.path.exists(ue4_editor_path)
-
-        # Additional checks for key directories that must be present
-        required_dirs = [
-            os.path.join(engine_path, "Engine", "Content"),
-            os.path.join(engine_path, "Engine", "Plugins"),
-            os.path.join(engine_path, "Engine", "Source")
-        ]
-
-        dirs_exist = all(os.path.isdir(d) for d in required_dirs)
-
-        return has_editor and dirs_exist
+        if _valid_layouts.get(engine_path) == mtimes:
+            return True
+        if not _validate_engine_layout(engine_path):
+            return False
+        _valid_layouts[engine_path] = mtimes
+        return True
 
     def find_unreal_in_registry(self) -> List[str]:
         """
@@ -87,27 +210,41 @@ class EngineFinder:
         self.log(log_msg)
         found_paths = []
 
+        # Registry roots are traversed as part of the loop, so they are never re-opened as subkeys
+        visited_keys = {reg_path.lower() for reg_path in self.REGISTRY_PATHS}
+        access = winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+
         for reg_path in self.REGISTRY_PATHS:
+            if reg_path in self._negative_paths:
+                continue
             try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path) as key:
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path, 0, access) as key:
                     subkeys_count, _, _ = winreg.QueryInfoKey(key)
                     for i in range(subkeys_count):
                         subkey_name = winreg.EnumKey(key, i)
+                        full_name = f"{reg_path}\\{subkey_name}".lower()
+                        if full_name in visited_keys:
+                            continue
+                        visited_keys.add(full_name)
                         try:
-                            with winreg.OpenKey(key, subkey_name) as subkey:
-                                install_path, _ = winreg.QueryValueEx(subkey, "InstalledDirectory")
-                                if os.path.exists(install_path) and self.is_valid_engine_path(install_path):
-                                    if self.localization:
-                                        success_msg = self.localization("log_engine_found_registry",
-                                                                        "Unreal Engine found in registry: {0}",
-                                                                        **{"0": install_path})
-                                    else:
-                                        success_msg = f"Unreal Engine found in registry: {install_path}"
-                                    self.log(success_msg, "SUCCESS")
-                                    found_paths.append(install_path)
-                        except FileNotFoundError:
+                            with winreg.OpenKey(key, subkey_name, 0, access) as subkey:
+                                install_path = self._read_installed_directory(subkey)
+                        except OSError:
+                            continue
+                        if not install_path or install_path in found_paths:
                             continue
+                        if self.is_valid_engine_path(install_path):
+                            if self.localization:
+                                success_msg = self.localization("log_engine_found_registry",
+                                                                "Unreal Engine found in registry: {0}",
+                                                                **{"0": install_path})
+                            else:
+                                success_msg = f"Unreal Engine found in registry: {install_path}"
+                            self.log(success_msg, "SUCCESS")
+                            found_paths.append(install_path)
             except FileNotFoundError:
+                self._negative_paths.add(reg_path)
+            except OSError:
                 continue
 
         if not found_paths:
@@ -117,6 +254,46 @@ class EngineFinder:
 
         return found_paths
 
+    @staticmethod
+    def _read_installed_directory(subkey: winreg.HKEYType) -> Optional[str]:
+        """
+        Read the InstalledDirectory string value of an engine registry key
+
+        Values are enumerated once and non-string values are skipped without a separate lookup.
+
+        :param subkey: Open registry key of an engine installation
+        :return: Installation path, or None if the key has no string InstalledDirectory value
+        """
+        _, values_count, _ = winreg.QueryInfoKey(subkey)
+        for i in range(values_count):
+            name, value, value_type = winreg.EnumValue(subkey, i)
+            if value_type in (winreg.REG_SZ, winreg.REG_EXPAND_SZ) and name.lower() == "installeddirectory":
+                return value
+        return None
+
+    def _collect_env_engine_paths(self, value: str, found_paths: List[str], require_engine_name: bool) -> None:
+        """
+        Add valid engine paths contained in an environment variable value
+
+        :param value: Variable value; PATH-like values are checked component by component
+        :param found_paths: List to append found engine paths to
+        :param require_engine_name: If True, only components containing a known engine name are checked
+        """
+        for candidate in value.split(os.pathsep):
+            if not candidate or candidate in found_paths:
+                continue
+            if require_engine_name and self._ENGINE_NAME_RE.search(candidate) is None:
+                continue
+            if self.is_valid_engine_path(candidate):
+                if self.localization:
+                    success_msg = self.localization("log_engine_found_env",
+                                                    "Unreal Engine found through environment variables: {0}",
+                                                    **{"0": candidate})
+                else:
+                    success_msg = f"Unreal Engine found through environment variables: {candidate}"
+                self.log(success_msg, "SUCCESS")
+                found_paths.append(candidate)
+
     def find_unreal_in_env_vars(self) -> List[str]:
         """
         Find paths to Unreal Engine in environment variables
@@ -124,17 +301,16 @@ class EngineFinder:
         self.log("Checking environment variables...")
         found_paths = []
 
-        for var in os.environ.values():
-            if any(engine_name in var for engine_name in self.POSSIBLE_ENGINE_NAMES):
-                if os.path.exists(var) and self.is_valid_engine_path(var):
-                    if self.localization:
-                        success_msg = self.localization("log_engine_found_env",
-                                                        "Unreal Engine found through environment variables: {0}",
-                                                        **{"0": var})
-                    else:
-                        success_msg = f"Unreal Engine found through environment variables: {var}"
-                    self.log(success_msg, "SUCCESS")
-                    found_paths.append(var)
+        # Dedicated engine variables are trusted as-is and usually make the full scan unnecessary
+        for var_name in self.ENGINE_ENV_VARS:
+            value = os.environ.get(var_name)
+            if value:
+                self._collect_env_engine_paths(value, found_paths, require_engine_name=False)
+
+        if not found_paths:
+            for value in os.environ.values():
+                if self._ENGINE_NAME_RE.search(value) is not None:
+                    self._collect_env_engine_paths(value, found_paths, require_engine_name=True)
 
         if not found_paths:
             not_found_msg = self.localization("log_engine_not_found_env",
@@ -143,6 +319,14 @@ class EngineFinder:
 
         return found_paths
 
+    def _get_existing_standard_paths(self) -> List[str]:
+        """
+        Return standard base paths that exist on this machine, checked once per finder
+        """
+        if self._existing_standard_paths is None:
+            self._existing_standard_paths = [path for path in self.STANDARD_PATHS if os.path.isdir(path)]
+        return self._existing_standard_paths
+
     def find_unreal_in_standard_paths(self) -> List[str]:
         """
         Find paths to Unreal Engine in standard locations
@@ -150,11 +334,15 @@ class EngineFinder:
         self.log("Searching standard installation paths...")
         found_paths = []
 
-        for base_path in self.STANDARD_PATHS:
+        for base_path in self._get_existing_standard_paths():
             try:
-                if os.path.exists(base_path):
-                    for subdir in os.listdir(base_path):
-                        engine_path = os.path.join(base_path, subdir)
+                # scandir yields cached entry types, so plain files are skipped without extra stat calls.
+                # Symlinks and junctions are followed, engines are often installed through them
+                with os.scandir(base_path) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        engine_path = entry.path
                         if self.is_valid_engine_path(engine_path):
                             if self.localization:
                                 success_msg = self.localization("log_engine_found_standard", "Unreal Engine found: {0}",
@@ -190,15 +378,16 @@ class EngineFinder:
 
         # Check Build.version file
         version_file = os.path.join(engine_path, "Engine", "Build", "Build.version")
-        if os.path.exists(version_file):
-            try:
-                with open(version_file, 'r') as f:
-                    version_data = json.load(f)
-                    major = version_data.get("MajorVersion", 0)
-                    minor = version_data.get("MinorVersion", 0)
-                    return f"{major}.{minor}"
-            except Exception as e:
-                self.log(f"Error reading version file: {e}", "WARNING")
+        try:
+            mtime_ns = os.stat(version_file).st_mtime_ns
+        except OSError:
+            return None
+
+        try:
+            major, minor = _read_build_version(version_file, mtime_ns)
+            return f"{major}.{minor}"
+        except Exception as e:
+            self.log(f"Error reading version file: {e}", "WARNING")
 
         return None
 
@@ -212,26 +401,17 @@ class EngineFinder:
         Returns:
             bool: True if successful, False otherwise
         """
-        config_data = {"unreal_engines": engines_data}
-
-        # Check write permission on directory
-        config_dir = os.path.dirname(self.config_file)
-        if not os.access(config_dir, os.W_OK):
-            self.log(f"No write permission for config directory: {config_dir}", "ERROR")
-            return False
+        config_data = {
+            "unreal_engines": engines_data,
+            "revalidate_interval": self.revalidate_interval,
+            "last_full_check": self.last_full_check,
+        }
 
-        # If file exists, check if we can write to it
-        if os.path.exists(self.config_file) and not os.access(self.config_file, os.W_OK):
-            self.log(f"No write permission for config file: {self.config_file}", "ERROR")
-            return False
-
-        # Now save the file
         try:
-            with open(self.config_file, "w", encoding="utf-8") as file:
-                json.dump(config_data, file, indent=4)
-            self.log(f"Unreal Engine paths saved to {self.config_file}")
+            if write_file_atomic(self.config_file, json_dumps(config_data)):
+                self.log(f"Unreal Engine paths saved to {self.config_file}")
             return True
-        except IOError as e:
+        except OSError as e:
             self.log(f"Error saving engine configuration: {e}", "ERROR")
             return False
 
@@ -245,15 +425,17 @@ class EngineFinder:
 
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, "r", encoding="utf-8") as file:
-                    config_data = json.load(file)
+                with open(self.config_file, "rb") as file:
+                    config_data = json_loads(file.read())
 
                     loaded_msg = self.localization("log_config_loaded",
                                                    "Configuration file loaded successfully.") if self.localization else "Configuration file loaded successfully."
                     self.log(loaded_msg)
 
+                    self.revalidate_interval = _config_int(config_data, "revalidate_interval", DEFAULT_REVALIDATE_INTERVAL)
+                    self.last_full_check = _config_int(config_data, "last_full_check", 0)
                     return config_data.get("unreal_engines", {})
-            except json.JSONDecodeError as e:
+            except JSONDecodeError as e:
                 self.log(f"Error reading configuration file: {e}", "WARNING")
         else:
             not_found_msg = self.localization("log_config_not_found",
@@ -283,16 +465,27 @@ class EngineFinder:
                     success_msg = "Unreal Engine paths loaded from configuration"
                 self.log(success_msg, "SUCCESS")
 
-                # Verify paths exist and are valid engines
+                # Verify paths exist and are valid engines. A full layout check runs once per
+                # revalidate_interval; in between, a broken install is caught when building.
+                now = int(time.time())
+                elapsed = now - self.last_full_check
+                # A timestamp in the future means the clock was changed, check right away
+                full_check = elapsed >= self.revalidate_interval or elapsed < 0
                 valid_engines = {}
                 for version, path in saved_engines.items():
-                    if os.path.exists(path) and self.is_valid_engine_path(path):
+                    is_valid = self.is_valid_engine_path(path) if full_check else os.path.isdir(path)
+                    if is_valid:
                         valid_engines[version] = path
                     else:
                         self.log(f"Engine version {version} at path {path} is no longer valid or complete", "WARNING")
 
                 if valid_engines:
                     self.found_engines = valid_engines
+                    # The file is only rewritten after a full check or when engines were dropped
+                    if full_check:
+                        self.last_full_check = now
+                    if full_check or len(valid_engines) != len(saved_engines):
+                        self.save_config(valid_engines)
                     return valid_engines
                 else:
                     invalid_msg = self.localization("log_paths_invalid",
@@ -300,26 +493,29 @@ class EngineFinder:
                     self.log(invalid_msg, "WARNING")
         elif force_rescan:
             self.log("Forced rescan requested. Ignoring configuration file.", "INFO")
+            _valid_layouts.clear()
+            self._existing_standard_paths = None
+            self._negative_paths.clear()
 
         all_paths = set()
+        search_methods = [
+            self.find_unreal_in_registry,  # 2. Search in registry
+            self.find_unreal_in_env_vars,  # 3. Search in environment variables
+            self.find_unreal_in_standard_paths,  # 4. Search in standard paths
+        ]
 
-        # 2. Search in registry
-        registry_paths = self.find_unreal_in_registry()
-        all_paths.update(registry_paths)
-        if stop_on_first and registry_paths:
-            return self._process_found_paths([registry_paths[0]])
-
-        # 3. Search in environment variables
-        env_paths = self.find_unreal_in_env_vars()
-        all_paths.update(env_paths)
-        if stop_on_first and env_paths:
-            return self._process_found_paths([env_paths[0]])
-
-        # 4. Search in standard paths
-        standard_paths = self.find_unreal_in_standard_paths()
-        all_paths.update(standard_paths)
-        if stop_on_first and standard_paths:
-            return self._process_found_paths([standard_paths[0]])
+        if stop_on_first:
+            # Methods run in priority order so the first hit wins
+            for search_method in search_methods:
+                found = search_method()
+                if found:
+                    return self._process_found_paths([found[0]])
+        else:
+            # The searches are independent and I/O-bound, so they run concurrently
+            with ThreadPoolExecutor(max_workers=len(search_methods)) as executor:
+                futures = [executor.submit(search_method) for search_method in search_methods]
+                for future in as_completed(futures):
+                    all_paths.update(future.result())
 
         # 5. If nothing found, notify about the need for manual entry
         if not all_paths:
@@ -334,20 +530,19 @@ class EngineFinder:
     def _process_found_paths(self, paths: List[str]) -> Dict[str, str]:
         """
         Process found paths, extract versions, and save configuration
+
+        :param paths: Engine root folders, already checked with is_valid_engine_path
         """
         result = {}
         for path in paths:
             version = self.extract_version_from_path(path)
             if version:
-                # Normalize path - ensure it points to UE root folder
-                normalized_path = path
-                if not os.path.exists(os.path.join(path, "Engine")):
-                    normalized_path = os.path.dirname(os.path.dirname(path))
-
-                self.log(self.localization("found_engine_version", f"Found Unreal Engine version {version}: {normalized_path}", **{"0": version, "1": normalized_path}) if self.localization else f"Found Unreal Engine version {version}: {normalized_path}", "SUCCESS")
-                result[version] = normalized_path
+                self.log(self.localization("found_engine_version", f"Found Unreal Engine version {version}: {path}", **{"0": version, "1": path}) if self.localization else f"Found Unreal Engine version {version}: {path}", "SUCCESS")
+                result[version] = path
 
         if result:
+            # Found paths have just passed the full layout check
+            self.last_full_check = int(time.time())
             self.save_config(result)
             self.found_engines = result
 
@@ -0,0 +1,78 @@
+"""
+JSON and file helpers for configuration and plugin files.
+Uses orjson when it is installed and falls back to the standard json module.
+"""
+import os
+import json
+import threading
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so one type covers both backends
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON document from raw file bytes
+
+    :param data: UTF-8 encoded JSON
+    :return: Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize object to indented UTF-8 JSON bytes
+
+    :param obj: Object to serialize
+    :return: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Same layout as orjson, so switching backends does not change file content
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_file_atomic(path: str, data: bytes) -> bool:
+    """
+    Write bytes to a file through a temporary file and os.replace
+
+    The file is left untouched if it already has exactly this content, and an
+    interrupted write can never leave a truncated file behind.
+
+    :param path: Destination file
+    :param data: New file content
+    :return: True if the file was written, False if it was already up to date
+    :raises OSError: If the file cannot be written
+    """
+    try:
+        with open(path, "rb") as file:
+            if file.read() == data:
+                return False
+    except OSError:
+        # Missing or unreadable file is simply rewritten
+        pass
+
+    # Process and thread ids make the name unique, so concurrent writers never share a temporary file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
@@ -1,11 +1,69 @@
 import os
-import json
 import re
-from typing import Optional, List, Dict, Any
+import copy
+import functools
+import subprocess
+from typing import Optional, List, Dict, Any, Tuple
 from PySide6.QtCore import QObject, Signal, QProcess
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from source.backend.json_io import json_loads
 from source.frontend.localization import LocalizationManager
 
+# Error, warning and success keywords combined so a line is classified in a single scan
+_CLASSIFY_RE = re.compile(r"(?P<ERROR>error|ошибка|failed)|(?P<WARNING>warning|предупреждение)"
+                          r"|(?P<SUCCESS>success|успешно|completed)", re.IGNORECASE)
+_PROGRESS_RE = re.compile(r"(\d+)%")
+# Lower value wins when a line contains keywords of several types
+_LOG_TYPE_PRIORITY = {"ERROR": 0, "WARNING": 1, "SUCCESS": 2}
+
+
+def _classify_line(line: str) -> str:
+    """
+    Determine log type of a build output line by its content
+
+    :param line: Output line
+    :return: ERROR, WARNING, SUCCESS or INFO
+    """
+    log_type = "INFO"
+    for match in _CLASSIFY_RE.finditer(line):
+        if match.lastgroup == "ERROR":
+            return "ERROR"
+        if log_type == "INFO" or _LOG_TYPE_PRIORITY[match.lastgroup] < _LOG_TYPE_PRIORITY[log_type]:
+            log_type = match.lastgroup
+    return log_type
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_uplugin(plugin_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a .uplugin file, memoized by path and mtime
+
+    Errors are raised to the caller and therefore never cached.
+
+    :param plugin_path: Path to the .uplugin file
+    :param mtime_ns: Modification time of the file, used as cache key
+    :return: Plugin information
+    """
+    with open(plugin_path, 'rb') as file:
+        plugin_data = json_loads(file.read())
+
+    return {
+        "name": plugin_data.get("FriendlyName", "Unknown Plugin"),
+        "version": plugin_data.get("Version", 0),
+        "description": plugin_data.get("Description", ""),
+        "category": plugin_data.get("Category", ""),
+        "modules": [m.get("Name") for m in plugin_data.get("Modules", [])],
+        "is_engine_plugin": plugin_data.get("EngineVersion", "") != "",
+        "engine_version": plugin_data.get("EngineVersion", ""),
+        "marketplace_url": plugin_data.get("MarketplaceURL", ""),
+        "supported_platforms": plugin_data.get("SupportedTargetPlatforms", []),
+    }
+
 
 class PluginBuilderSignals(QObject):
     """
@@ -30,6 +88,8 @@ class PluginBuilder:
         self.target_engine_path = None
         self.additional_params = {}
         self.localization = localization
+        # Partial output line kept until the rest of the line arrives
+        self._stdout_tail = b""
 
     def log(self, message: str, log_type: str = "INFO") -> None:
         """
@@ -38,34 +98,29 @@ class PluginBuilder:
         print(f"[{log_type}] {message}")
         self.signals.log_message.emit(message, log_type)
 
-    def extract_plugin_info(self, plugin_path: str) -> Optional[Dict[str, Any]]:
+    def extract_plugin_info(self, plugin_path: str, mtime_ns: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Extract information from the .uplugin file
+
+        :param plugin_path: Path to the .uplugin file
+        :param mtime_ns: Modification time of the file if the caller already has it (e.g. from DirEntry.stat())
+        :return: Plugin information, or None if the file cannot be read
         """
         try:
-            with open(plugin_path, 'r', encoding='utf-8') as file:
-                plugin_data = json.load(file)
-
-            info = {
-                "name": plugin_data.get("FriendlyName", "Unknown Plugin"),
-                "version": plugin_data.get("Version", 0),
-                "description": plugin_data.get("Description", ""),
-                "category": plugin_data.get("Category", ""),
-                "modules": [m.get("Name") for m in plugin_data.get("Modules", [])],
-                "is_engine_plugin": plugin_data.get("EngineVersion", "") != "",
-                "engine_version": plugin_data.get("EngineVersion", ""),
-                "marketplace_url": plugin_data.get("MarketplaceURL", ""),
-                "supported_platforms": plugin_data.get("SupportedTargetPlatforms", []),
-            }
-
-            return info
+            if mtime_ns is None:
+                mtime_ns = os.stat(plugin_path).st_mtime_ns
+            # Deep copy, so callers cannot modify the cached result or the lists nested in it
+            return copy.deepcopy(_parse_uplugin(plugin_path, mtime_ns))
         except Exception as e:
             self.log(f"Error reading plugin information: {e}", "ERROR")
             return None
 
-    def get_build_command(self) -> Optional[List[str]]:
+    def _build_argv(self) -> Optional[List[str]]:
         """
         Create the command for building the plugin
+
+        :return: List [RunUAT.bat, BuildPlugin, -Param=value, ...] exactly as passed to the process,
+                 or None if the command cannot be formed
         """
         if not self.source_plugin_path or not self.output_folder or not self.target_engine_path:
             self.log(self.localization("not_all_parameters_set", "Not all required parameters are set for building")
@@ -83,58 +138,36 @@ class PluginBuilder:
             self.log(error_msg, "ERROR")
             return None
 
-        # Normalize paths to avoid mixing slashes
-        source_plugin_path = os.path.normpath(self.source_plugin_path)
-        output_folder = os.path.normpath(self.output_folder)
+        # Normalize paths and use forward slashes for consistency
+        source_plugin_path = os.path.normpath(self.source_plugin_path).replace("\\", "/")
+        output_folder = os.path.normpath(self.output_folder).replace("\\", "/")
 
         # Base command
-        command = [
+        argv = [
             uat_path,
             "BuildPlugin",
-            "-plugin",
-            source_plugin_path,
-            "-package",
-            output_folder,
+            f"-Plugin={source_plugin_path}",
+            f"-Package={output_folder}",
         ]
 
-        # Add additional parameters
+        # Add additional parameters as -Flag or -Param=Value (first letter capitalized)
         for param, value in self.additional_params.items():
-            if value is True:
-                command.append(f"-{param}")
-            elif value not in (False, None, ""):
-                command.append(f"-{param}")
-                command.append(str(value))
-        return command
+            param = param.lstrip("-")
+            if not param or value in (False, None, ""):
+                continue
+            param = param[0].upper() + param[1:]
+            argv.append(f"-{param}" if value is True else f"-{param}={value}")
+        return argv
 
     def get_command_string(self) -> str:
         """
         Return string representation of the command
         """
-        command = self.get_build_command()
-        if not command:
+        argv = self._build_argv()
+        if not argv:
             return ""
-
-        # Format arguments with quotes for paths with spaces
-        formatted_command = [command[0]]  # RunUAT.bat
-        formatted_command.append(command[1])  # BuildPlugin
-
-        for i in range(2, len(command), 2):
-            if i + 1 < len(command):
-                # If next argument is a path, add quotes
-                param = command[i]
-                value = command[i + 1]
-                # Normalize path using consistent slashes
-                if os.path.exists(os.path.dirname(value)):
-                    # Replace all backslashes with forward slashes for consistency
-                    value = value.replace("\\", "/")
-                    formatted_command.append(f'{param}="{value}"')
-                else:
-                    formatted_command.append(f'{param}={value}')
-            else:
-                # If this is the last argument without value
-                formatted_command.append(command[i])
-
-        return " ".join(formatted_command)
+        # Quoted the same way as the arguments passed to the process
+        return subprocess.list2cmdline(argv)
 
     def build_plugin(self, source_plugin_path: str, output_folder: str,
                      target_engine_path: str, additional_params: dict = None) -> bool:
@@ -167,13 +200,12 @@ class PluginBuilder:
             self.log(f"Failed to create output directory: {e}", "ERROR")
             return False
 
-        # Получаем базовую команду
-        command = self.get_build_command()
-        if not command:
+        # Получаем команду один раз: она же логируется и запускается
+        argv = self._build_argv()
+        if not argv:
             return False
 
-        # Логируем строковое представление команды
-        command_str = self.get_command_string()
+        command_str = subprocess.list2cmdline(argv)
         log_msg = f"Build command: {command_str}"
         if self.localization:
             log_msg = self.localization("log_build_command", log_msg, **{"0": command_str})
@@ -182,37 +214,14 @@ class PluginBuilder:
         # Start the process
         self.signals.build_started.emit()
 
+        self._stdout_tail = b""
         self.process = QProcess()
+        # stderr is merged into stdout, so all output goes through one stream and one classifier
+        self.process.setProcessChannelMode(QProcess.MergedChannels)
         self.process.readyReadStandardOutput.connect(self._process_stdout)
-        self.process.readyReadStandardError.connect(self._process_stderr)
         self.process.finished.connect(self._process_finished)
 
-        # Формируем параметры в правильном формате, как в get_command_string()
-        # Но для QProcess нам нужен список, а не строка
-        formatted_args = [command[1]]  # BuildPlugin
-
-        for i in range(2, len(command), 2):
-            if i + 1 < len(command):
-                # Параметр и значение с "="
-                param = command[i]
-                value = command[i + 1]
-
-                # Заменяем обратные слеши на прямые
-                if os.path.exists(os.path.dirname(value)):
-                    value = value.replace("\\", "/")
-
-                # Приводим к формату параметр=значение (без кавычек - QProcess добавит их при необходимости)
-                param_name = param.lstrip('-')  # Убираем "-"
-                param_name = param_name[0].upper() + param_name[1:]  # Первая буква заглавная
-                formatted_args.append(f"-{param_name}={value}")
-            else:
-                # Просто параметр без значения
-                param = command[i].lstrip('-')
-                param = param[0].upper() + param[1:]
-                formatted_args.append(f"-{param}")
-
-        # Запускаем процесс с правильно отформатированными аргументами
-        self.process.start(command[0], formatted_args)
+        self.process.start(argv[0], argv[1:])
 
         return True
 
@@ -220,41 +229,52 @@ class PluginBuilder:
         """
         Process standard output from the process
         """
-        data = self.process.readAllStandardOutput().data().decode('utf-8', errors='replace')
-        for line in data.splitlines():
-            line = line.strip()
-            if line:
-                # Determine message type by content
-                log_type = "INFO"
-                if re.search(r'error|ошибка|failed', line, re.IGNORECASE):
-                    log_type = "ERROR"
-                elif re.search(r'warning|предупреждение', line, re.IGNORECASE):
-                    log_type = "WARNING"
-                elif re.search(r'success|успешно|completed', line, re.IGNORECASE):
-                    log_type = "SUCCESS"
-
-                self.log(line, log_type)
-
-                # Try to determine progress
-                progress_match = re.search(r'(\d+)%', line)
-                if progress_match:
-                    progress = int(progress_match.group(1))
-                    self.signals.build_progress.emit(progress)
-
-    def _process_stderr(self) -> None:
+        data = self.process.readAllStandardOutput().data()
+        lines, self._stdout_tail = self._split_complete_lines(self._stdout_tail + data)
+        for raw_line in lines:
+            self._handle_stdout_line(raw_line)
+
+    @staticmethod
+    def _split_complete_lines(buffer: bytes) -> Tuple[List[bytes], bytes]:
+        """
+        Split buffered output into complete lines and the trailing partial line
+
+        :param buffer: Unprocessed output bytes
+        :return: Tuple (complete lines, partial line to keep for the next read)
         """
-        Process standard error output from the process
+        lines = buffer.split(b"\n")
+        tail = lines.pop()
+        return lines, tail
+
+    def _handle_stdout_line(self, raw_line: bytes) -> None:
         """
-        data = self.process.readAllStandardError().data().decode('utf-8', errors='replace')
-        for line in data.splitlines():
-            line = line.strip()
-            if line:
-                self.log(line, "ERROR")
+        Log a single line of standard output and report progress found in it
+        """
+        line = raw_line.decode('utf-8', errors='replace').strip()
+        if not line:
+            return
+
+        # Determine message type by content
+        log_type = _classify_line(line)
+
+        self.log(line, log_type)
+
+        # Try to determine progress; very few lines contain "%", so check the raw bytes first
+        if b"%" in raw_line:
+            progress_match = _PROGRESS_RE.search(line)
+            if progress_match:
+                progress = int(progress_match.group(1))
+                self.signals.build_progress.emit(progress)
 
     def _process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
         """
         Called when the process finishes
         """
+        # Output that did not end with a line break is still pending in the buffer
+        if self._stdout_tail:
+            self._handle_stdout_line(self._stdout_tail)
+            self._stdout_tail = b""
+
         if exit_code == 0:
             success_msg = "Plugin build completed successfully"
             if self.localization:
@@ -268,6 +288,34 @@ class PluginBuilder:
             self.log(error_msg, "ERROR")
             self.signals.build_finished.emit(False, error_msg)
 
+    @staticmethod
+    def _kill_process_tree(pid: int) -> None:
+        """
+        Kill a process together with all of its child processes and wait for them to exit
+
+        Only the actual descendants are terminated, so unrelated UnrealBuildTool
+        instances are left running. Falls back to taskkill if psutil is not installed.
+
+        :param pid: ID of the root process
+        """
+        if psutil is None:
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return
+
+        try:
+            parent = psutil.Process(pid)
+            processes = parent.children(recursive=True) + [parent]
+        except psutil.Error:
+            return
+
+        for proc in processes:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(processes, timeout=5)
+
     def cancel_build(self) -> bool:
         """
         Cancel the current plugin build by terminating the entire process tree,
@@ -279,28 +327,8 @@ class PluginBuilder:
         # Получаем PID процесса
         pid = self.process.processId()
 
-        # Завершаем всё дерево процессов через Popen и wait
-        import subprocess
-
-        # Сначала убиваем основной процесс и его дочерние процессы
-        proc = subprocess.Popen(
-            f"taskkill /F /PID {pid} /T",
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        proc.wait()  # Ждем завершения команды taskkill
-
-        # Дополнительно убиваем процессы сборки которые могли быть созданы
-        build_procs = ["UnrealBuildTool.exe", "UBT.exe"]
-        for proc_name in build_procs:
-            proc = subprocess.Popen(
-                f"taskkill /F /IM {proc_name}",
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            proc.wait()  # Ждем завершения каждой команды
+        # Завершаем всё дерево процессов и ждем его завершения
+        self._kill_process_tree(pid)
 
         # После ожидания завершения всех процессов пытаемся удалить папку
         if self.output_folder and os.path.exists(self.output_folder):
@@ -0,0 +1,131 @@
+"""
+Default English translations shipped with the application
+"""
+
+TRANSLATIONS = {
+    "main_window_title": "UE Plugin Builder",
+    "engine_group": "Unreal Engine",
+    "source_version_label": "Source UE Version:",
+    "target_version_label": "Target UE Version:",
+    "plugin_group": "Plugin",
+    "plugin_file_label": "Select .uplugin file:",
+    "plugin_info_label": "Plugin Information:",
+    "plugin_info_empty": "No information. Please select a plugin...",
+    "plugin_info_name": "Name:",
+    "plugin_info_version": "Version:",
+    "plugin_info_category": "Category:",
+    "plugin_info_description": "Description:",
+    "plugin_info_modules": "Modules:",
+    "plugin_info_engine_version": "Engine Version:",
+    "plugin_info_marketplace_url": "Marketplace URL:",
+    "plugin_info_supported_platforms": "Supported Platforms:",
+    "select_uplugin_file": "Select .uplugin file",
+    "uplugin_file_filter": "Unreal Plugin (*.uplugin)",
+    "select_output_folder": "Select folder to save plugin",
+    "drop_hint": "Or drag & drop plugin folder here",
+    "output_group": "Output Directory",
+    "same_dir_radio": "To parent directory",
+    "other_dir_radio": "Select another directory",
+    "advanced_button": "Advanced Options",
+    "help_button": "BuildPlugin Help",
+    "clear_console_button": "Clear Console",
+    "show_command_button": "Show Command",
+    "build_button": "Build Plugin",
+    "abort_button": "Cancel Build",
+    "cancel_build_title": "Cancel Build?",
+    "cancel_build_message": "Are you sure you want to cancel the current build?",
+    "cancel_failed": "No active build process to cancel.",
+    "ready_message": "Ready to rebuild plugin.",
+    "select_plugin_message": "Select plugin and build parameters, then click \"Rebuild Plugin\".",
+    "command_dialog_title": "Build Command",
+    "command_label": "Command to run in command line:",
+    "error_title": "Error",
+    "error_no_plugin": "No plugin selected for build.",
+    "error_plugin_not_found": "Plugin file not found: {0}",
+    "error_no_output": "Output path not specified.",
+    "error_no_target_engine": "Target Unreal Engine version not selected.",
+    "error_cannot_start_build": "Failed to start plugin build. Check parameters and logs.",
+    "build_running": "Building...",
+    "build_success_title": "Build Complete",
+    "build_success_message": "Plugin successfully built to: {0}",
+    "plugin_path_placeholder": "Path to plugin file...",
+    "plugin_info_error": "Error reading plugin information.",
+    "no_engines_warning": "No Unreal Engine installations added. Please add engines via Advanced Options.",
+    "build_parameters_group": "Build Parameters",
+    "quick_search_failed": "Quick search methods failed to find Unreal Engine installations.",
+    "manual_entry_required": "Manual entry will be required.",
+    "found_engine_version": "Found Unreal Engine version {0}: {1}",
+    "version_match_warning": "Warning: Target version matches plugin version!",
+    # Advanced options
+    "advanced_dialog_title": "Advanced Options",
+    "language_settings": "Language Settings",
+    "language_label": "Interface Language:",
+    "platforms_label": "Target Platforms:",
+    "options_label": "Build Options:",
+    "create_dist_checkbox": "CreateSubFolder (create subfolder with build date)",
+    "no_host_platform_checkbox": "NoHostPlatform (do not build for host platform)",
+    "include_debug_files_checkbox": "IncludeDebugFiles (include debug files)",
+    "strict_checkbox": "Strict (strict compilation)",
+    "unversioned_checkbox": "Unversioned (do not embed engine version in descriptor)",
+    "extra_params_label": "Additional command line parameters:",
+    "extra_params_placeholder": "-Param1=Value1 -Param2=Value2",
+    "rescan_engines_button": "Rescan Engines",
+    "rescan_title": "Scanning Engines",
+    "rescan_message": "Unreal Engine scanning started.",
+    "help_error_engine": "Failed to get Unreal Engine path.",
+    "help_error_target": "Select target Unreal Engine version.",
+    "help_error_uat": "RunUAT.bat file not found at path: {0}",
+    "help_start": "Getting BuildPlugin help...",
+    "help_error": "Error getting help: {0}",
+    "help_header": "=== BuildPlugin Help ===",
+    "help_footer": "=== End of Help ===",
+    # Manual engine dialog text
+    "manual_engines_title": "Add Unreal Engine Installations",
+    "manual_engines_instructions": "Automatic search didn't find any Unreal Engine installations.\nPlease add your Unreal Engine installations manually.",
+    "manual_engines_edit_instructions": "Manage your Unreal Engine installations below.\nYou can add new installations or remove existing ones.",
+    "engine_version_label": "Engine Version:",
+    "engine_path_label": "Engine Path:",
+    "engine_version_placeholder": "e.g. 5.1",
+    "engine_path_placeholder": "Path to Unreal Engine",
+    "add_engine_button": "Add Engine",
+    "remove_engine_button": "Remove Selected",
+    "save_engines_button": "Save and Continue",
+    "cancel_button": "Cancel",
+    "select_engine_folder": "Select Unreal Engine Directory",
+    "error_no_version": "Please enter an engine version.",
+    "error_no_path": "Please select an engine path.",
+    "invalid_engine_title": "Invalid Engine Path",
+    "invalid_engine_message": "This doesn't appear to be a valid Unreal Engine installation.\nDo you want to add it anyway?",
+    "engines_added_title": "Engines Modified",
+    "engines_added_message": "Unreal Engine installations have been updated.",
+    "add_engines_button": "Add Unreal Engine...",
+    # Console logs
+    "log_info": "INFO",
+    "log_error": "ERROR",
+    "log_warning": "WARNING",
+    "log_success": "SUCCESS",
+    "log_engines_search_start": "Starting Unreal Engine search...",
+    "log_engine_found_registry": "Unreal Engine found in registry: {0}",
+    "log_engine_not_found_registry": "Unreal Engine not found in registry.",
+    "log_engine_found_env": "Unreal Engine found through environment variables: {0}",
+    "log_engine_not_found_env": "Unreal Engine not found in environment variables.",
+    "log_engine_found_standard": "Unreal Engine found: {0}",
+    "log_engine_not_found_standard": "Unreal Engine not found in standard paths.",
+    "log_searching_disk": "Scanning disk: {0}",
+    "log_engine_found_disk": "Unreal Engine found on disk {0}: {1}",
+    "log_engine_not_found_disk": "Unreal Engine not found on disks.",
+    "log_config_check": "Checking configuration file...",
+    "log_config_loaded": "Configuration file loaded successfully.",
+    "log_config_not_found": "Configuration file not found.",
+    "log_engines_loaded": "Unreal Engine paths loaded from configuration",
+    "log_paths_invalid": "Saved paths are invalid, performing new search",
+    "log_engine_not_found": "Unreal Engine not found.",
+    "log_build_start": "Starting plugin build...",
+    "log_build_command": "Build command: {0}",
+    "log_build_success": "Plugin build completed successfully",
+    "log_build_error": "Plugin build failed with error (code: {0})",
+    "log_build_cancelled": "Plugin build cancelled by user",
+    "language_ru": "Русский",
+    "language_en": "English",
+    "apply_language": "Apply",
+}
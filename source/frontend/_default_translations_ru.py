@@ -0,0 +1,131 @@
+"""
+Default Russian translations shipped with the application
+"""
+
+TRANSLATIONS = {
+    "main_window_title": "UE Plugin Builder",
+    "engine_group": "Unreal Engine",
+    "source_version_label": "Исходная версия UE:",
+    "target_version_label": "Целевая версия UE:",
+    "plugin_group": "Плагин",
+    "plugin_file_label": "Выберите .uplugin файл:",
+    "plugin_info_label": "Информация о плагине:",
+    "plugin_info_empty": "Нет информации. Выберите плагин...",
+    "plugin_info_name": "Имя:",
+    "plugin_info_version": "Версия:",
+    "plugin_info_category": "Категория:",
+    "plugin_info_description": "Описание:",
+    "plugin_info_modules": "Модули:",
+    "plugin_info_engine_version": "Версия движка:",
+    "plugin_info_marketplace_url": "URL в Marketplace:",
+    "plugin_info_supported_platforms": "Поддерживаемые платформы:",
+    "select_uplugin_file": "Выберите файл .uplugin",
+    "uplugin_file_filter": "Плагин Unreal (*.uplugin)",
+    "select_output_folder": "Выберите папку для сохранения плагина",
+    "drop_hint": "Или перетащите папку с плагином сюда",
+    "output_group": "Выходной каталог",
+    "same_dir_radio": "В родительскую директорию с версией UE",
+    "other_dir_radio": "Выбрать другую директорию",
+    "advanced_button": "Дополнительные параметры",
+    "help_button": "Справка BuildPlugin",
+    "clear_console_button": "Очистить консоль",
+    "show_command_button": "Показать команду",
+    "build_button": "Собрать плагин",
+    "abort_button": "Прервать сборку",
+    "cancel_build_title": "Отменить сборку?",
+    "cancel_build_message": "Вы уверены, что хотите отменить текущую сборку?",
+    "cancel_failed": "Нет активного процесса сборки для отмены.",
+    "ready_message": "Готов к сборке плагина.",
+    "select_plugin_message": "Выберите плагин и параметры сборки, затем нажмите \"Собрать плагин\".",
+    "command_dialog_title": "Команда сборки",
+    "command_label": "Команда для запуска в командной строке:",
+    "error_title": "Ошибка",
+    "error_no_plugin": "Не выбран плагин для сборки.",
+    "error_plugin_not_found": "Файл плагина не найден: {0}",
+    "error_no_output": "Не указан путь для сохранения собранного плагина.",
+    "error_no_target_engine": "Не выбрана целевая версия Unreal Engine.",
+    "error_cannot_start_build": "Не удалось запустить сборку плагина. Проверьте параметры и логи.",
+    "build_running": "Идет сборка...",
+    "build_success_title": "Сборка завершена",
+    "build_success_message": "Плагин успешно собран в: {0}",
+    "plugin_path_placeholder": "Путь к файлу плагина...",
+    "plugin_info_error": "Ошибка чтения информации о плагине.",
+    "no_engines_warning": "Установки Unreal Engine не добавлены. Пожалуйста, добавьте их через Дополнительные параметры.",
+    "build_parameters_group": "Параметры сборки",
+    "quick_search_failed": "Быстрый поиск не смог найти установки Unreal Engine.",
+    "manual_entry_required": "Потребуется ручной ввод.",
+    "found_engine_version": "Найдена версия Unreal Engine {0}: {1}",
+    # Advanced options
+    "advanced_dialog_title": "Дополнительные параметры",
+    "language_settings": "Настройки языка",
+    "language_label": "Язык интерфейса:",
+    "platforms_label": "Целевые платформы:",
+    "options_label": "Опции компиляции:",
+    "create_dist_checkbox": "CreateSubFolder (создать подпапку с датой сборки)",
+    "no_host_platform_checkbox": "NoHostPlatform (не собирать для хост-платформы)",
+    "include_debug_files_checkbox": "IncludeDebugFiles (включить отладочные файлы)",
+    "strict_checkbox": "Strict (строгая компиляция)",
+    "unversioned_checkbox": "Unversioned (не встраивать версию движка в дескриптор)",
+    "extra_params_label": "Дополнительные параметры командной строки:",
+    "extra_params_placeholder": "-Param1=Value1 -Param2=Value2",
+    "rescan_engines_button": "Пересканировать движки",
+    "rescan_title": "Сканирование движков",
+    "rescan_message": "Запущено сканирование Unreal Engine.",
+    "help_error_engine": "Не удалось получить путь к Unreal Engine.",
+    "help_error_target": "Выберите целевую версию Unreal Engine.",
+    "help_error_uat": "Не найден файл RunUAT.bat по пути: {0}",
+    "help_start": "Получение справки по BuildPlugin...",
+    "help_error": "Ошибка при получении справки: {0}",
+    "help_header": "=== Справка по BuildPlugin ===",
+    "help_footer": "=== Конец справки ===",
+    "version_match_warning": "Внимание: Целевая версия совпадает с версией плагина!",
+    # Manual engine dialog
+    "manual_engines_title": "Добавить установки Unreal Engine",
+    "manual_engines_instructions": "Автоматический поиск не обнаружил установок Unreal Engine.\nПожалуйста, добавьте ваши установки Unreal Engine вручную.",
+    "manual_engines_edit_instructions": "Управление установками Unreal Engine.\nВы можете добавлять новые установки или удалять существующие.",
+    "engine_version_label": "Версия движка:",
+    "engine_path_label": "Путь к движку:",
+    "engine_version_placeholder": "например, 5.1",
+    "engine_path_placeholder": "Путь к Unreal Engine",
+    "add_engine_button": "Добавить движок",
+    "remove_engine_button": "Удалить выбранный",
+    "save_engines_button": "Сохранить и продолжить",
+    "cancel_button": "Отмена",
+    "select_engine_folder": "Выберите директорию Unreal Engine",
+    "error_no_version": "Пожалуйста, введите версию движка.",
+    "error_no_path": "Пожалуйста, выберите путь к движку.",
+    "invalid_engine_title": "Недействительный путь к движку",
+    "invalid_engine_message": "Этот путь не похож на правильную установку Unreal Engine.\nВсё равно добавить его?",
+    "engines_added_title": "Движки изменены",
+    "engines_added_message": "Установки Unreal Engine были обновлены.",
+    "add_engines_button": "Добавить Unreal Engine...",
+    # Console logs
+    "log_info": "ИНФО",
+    "log_error": "ОШИБКА",
+    "log_warning": "ПРЕДУПРЕЖДЕНИЕ",
+    "log_success": "УСПЕХ",
+    "log_engines_search_start": "Начинаю поиск Unreal Engine...",
+    "log_engine_found_registry": "Unreal Engine найден в реестре: {0}",
+    "log_engine_not_found_registry": "Unreal Engine не найден в реестре.",
+    "log_engine_found_env": "Unreal Engine найден через переменные окружения: {0}",
+    "log_engine_not_found_env": "Unreal Engine не найден в переменных окружения.",
+    "log_engine_found_standard": "Unreal Engine найден: {0}",
+    "log_engine_not_found_standard": "Unreal Engine не найден в стандартных путях.",
+    "log_searching_disk": "Сканирую диск: {0}",
+    "log_engine_found_disk": "Unreal Engine найден на диске {0}: {1}",
+    "log_engine_not_found_disk": "Unreal Engine не найден на дисках.",
+    "log_config_check": "Проверяю конфигурационный файл...",
+    "log_config_loaded": "Конфигурационный файл загружен успешно.",
+    "log_config_not_found": "Конфигурационный файл не найден.",
+    "log_engines_loaded": "Пути к Unreal Engine загружены из конфигурации",
+    "log_paths_invalid": "Сохраненные пути недействительны, выполняется новый поиск",
+    "log_engine_not_found": "Unreal Engine не найден.",
+    "log_build_start": "Начинаю сборку плагина...",
+    "log_build_command": "Команда сборки: {0}",
+    "log_build_success": "Сборка плагина успешно завершена",
+    "log_build_error": "Сборка плагина завершилась с ошибкой (код: {0})",
+    "log_build_cancelled": "Сборка плагина отменена пользователем",
+    "language_ru": "Русский",
+    "language_en": "English",
+    "apply_language": "Применить",
+}
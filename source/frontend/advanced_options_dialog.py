@@ -3,43 +3,89 @@ from PySide6.QtWidgets import (
     QLabel, QCheckBox, QComboBox, QLineEdit, QPushButton,
     QDialogButtonBox, QMessageBox, QWidget
 )
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QShowEvent
+import re
 from typing import Optional, Dict, Any
 
 from source.frontend.localization import LocalizationManager
 from source.frontend.manual_engine_dialog import ManualEngineEntryDialog
 
+# Static dialog texts: localization key -> default text
+_DIALOG_STRINGS = {
+    "advanced_dialog_title": "Advanced Options",
+    "rescan_engines_button": "Rescan Engines",
+    "add_engine_button": "Add Unreal Engine...",
+    "language_settings": "Language Settings",
+    "language_label": "Interface Language:",
+    "language_en": "English",
+    "language_ru": "Русский",
+    "apply_language": "Apply",
+    "build_parameters_group": "Build Parameters",
+    "platforms_label": "Target Platforms:",
+    "options_label": "Build Options:",
+    "create_dist_checkbox": "CreateSubFolder (create subfolder with build date)",
+    "no_host_platform_checkbox": "NoHostPlatform (do not build for host platform)",
+    "include_debug_files_checkbox": "IncludeDebugFiles (include debug files)",
+    "strict_checkbox": "Strict (strict compilation)",
+    "unversioned_checkbox": "Unversioned (do not embed engine version in descriptor)",
+    "extra_params_label": "Additional command line parameters:",
+    "extra_params_placeholder": "-Param1=Value1 -Param2=Value2",
+}
+
+# Custom command line parameter: -Flag or -Param=Value, only at the start of a token
+_EXTRA_PARAM_RE = re.compile(r"(?<!\S)-([^\s=]+)(?:=(\S*))?")
+
 
 class AdvancedOptionsDialog(QDialog):
     """
     Dialog with advanced plugin build options
     """
 
+    # Option checkboxes: (attribute and localization key, BuildPlugin flag)
+    _OPTION_CHECKBOXES = (
+        ("create_dist_checkbox", "CreateSubFolder"),
+        ("no_host_platform_checkbox", "NoHostPlatform"),
+        ("include_debug_files_checkbox", "IncludeDebugFiles"),
+        ("strict_checkbox", "Strict"),
+        ("unversioned_checkbox", "Unversioned"),
+    )
+
     def __init__(self, parent: Optional[QWidget] = None, localization: Optional[LocalizationManager] = None) -> None:
         super().__init__(parent)
         self.localization = localization
         self.parent_window = parent
 
-        self.setWindowTitle(self.localize("advanced_dialog_title", "Advanced Options"))
+        # Fetch all static texts of the dialog in one call
+        self.texts = localization.get_many(_DIALOG_STRINGS) if localization else dict(_DIALOG_STRINGS)
+
+        self.setWindowTitle(self.texts["advanced_dialog_title"])
         self.setMinimumWidth(500)
 
         layout = QVBoxLayout(self)
 
-        # Create language settings group
-        layout.addWidget(self.create_language_settings_group())
+        # Group contents are created on first show, see showEvent
+        language_group = QGroupBox(self.texts["language_settings"])
+        layout.addWidget(language_group)
 
-        # Create build parameters group
-        layout.addWidget(self.create_build_parameters_group())
+        params_group = QGroupBox(self.texts["build_parameters_group"])
+        layout.addWidget(params_group)
+
+        self._pending_groups = [
+            (self.create_language_settings_group, language_group),
+            (self.create_build_parameters_group, params_group),
+        ]
 
         # Additional buttons
         buttons_layout = QHBoxLayout()
 
         # Engine rescan button
-        self.rescan_engines_button = QPushButton(self.localize("rescan_engines_button", "Rescan Engines"))
+        self.rescan_engines_button = QPushButton(self.texts["rescan_engines_button"])
         self.rescan_engines_button.clicked.connect(self.rescan_engines)
 
 
         # Add Engine button
-        self.add_engine_button = QPushButton(self.localize("add_engine_button", "Add Unreal Engine..."))
+        self.add_engine_button = QPushButton(self.texts["add_engine_button"])
         self.add_engine_button.clicked.connect(self.add_unreal_engine)
 
         buttons_layout.addWidget(self.rescan_engines_button)
@@ -61,19 +107,36 @@ class AdvancedOptionsDialog(QDialog):
             return self.localization(key, default)
         return default
 
-    def create_language_settings_group(self) -> QGroupBox:
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Populate groups when the dialog is shown for the first time
         """
-        Create language settings group
+        if self._pending_groups:
+            self.populate_groups()
+            self.adjustSize()
+        super().showEvent(event)
+
+    def populate_groups(self) -> None:
+        """
+        Create contents of the groups that are not populated yet
+        """
+        while self._pending_groups:
+            create_group, group = self._pending_groups.pop(0)
+            create_group(group)
+
+    def create_language_settings_group(self, language_group: QGroupBox) -> None:
         """
-        language_group = QGroupBox(self.localize("language_settings", "Language Settings"))
+        Create language settings group contents
 
+        :param language_group: Group box to populate
+        """
         language_layout = QFormLayout(language_group)
         language_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
 
-        language_label = QLabel(self.localize("language_label", "Interface Language:"))
+        language_label = QLabel(self.texts["language_label"])
         self.language_combo = QComboBox()
-        self.language_combo.addItem(self.localize("language_en", "English"), "en")
-        self.language_combo.addItem(self.localize("language_ru", "Русский"), "ru")
+        self.language_combo.addItem(self.texts["language_en"], "en")
+        self.language_combo.addItem(self.texts["language_ru"], "ru")
 
         # Set current language
         if self.localization:
@@ -82,24 +145,22 @@ class AdvancedOptionsDialog(QDialog):
             if index >= 0:
                 self.language_combo.setCurrentIndex(index)
 
-        self.apply_language_button = QPushButton(self.localize("apply_language", "Apply"))
+        self.apply_language_button = QPushButton(self.texts["apply_language"])
         self.apply_language_button.clicked.connect(self.apply_language)
 
         language_layout.addRow(language_label, self.language_combo)
         language_layout.addRow("", self.apply_language_button)
 
-        return language_group
-
-    def create_build_parameters_group(self) -> QGroupBox:
-        """
-        Create build parameters group
+    def create_build_parameters_group(self, params_group: QGroupBox) -> None:
         """
-        params_group = QGroupBox(self.localize("build_parameters_group", "Build Parameters"))
+        Create build parameters group contents
 
+        :param params_group: Group box to populate
+        """
         params_layout = QVBoxLayout(params_group)
 
         # Platforms - only supported for plugins
-        platforms_label = QLabel(self.localize("platforms_label", "Target Platforms:"))
+        platforms_label = QLabel(self.texts["platforms_label"])
         self.platforms_container = QWidget()
         platforms_layout = QVBoxLayout(self.platforms_container)
         platforms_layout.setContentsMargins(0, 0, 0, 0)
@@ -114,33 +175,21 @@ class AdvancedOptionsDialog(QDialog):
             self.platform_checkboxes[platform] = checkbox
 
         # Compilation options
-        options_label = QLabel(self.localize("options_label", "Build Options:"))
+        options_label = QLabel(self.texts["options_label"])
         self.options_container = QWidget()
         options_layout = QVBoxLayout(self.options_container)
         options_layout.setContentsMargins(0, 0, 0, 0)
 
         # Create checkboxes for options
-        self.create_dist_checkbox = QCheckBox(
-            self.localize("create_dist_checkbox", "CreateSubFolder (create subfolder with build date)"))
-        self.no_host_platform_checkbox = QCheckBox(
-            self.localize("no_host_platform_checkbox", "NoHostPlatform (do not build for host platform)"))
-        self.include_debug_files_checkbox = QCheckBox(
-            self.localize("include_debug_files_checkbox", "IncludeDebugFiles (include debug files)"))
-        self.strict_checkbox = QCheckBox(
-            self.localize("strict_checkbox", "Strict (strict compilation)"))
-        self.unversioned_checkbox = QCheckBox(
-            self.localize("unversioned_checkbox", "Unversioned (do not embed engine version in descriptor)"))
-
-        options_layout.addWidget(self.create_dist_checkbox)
-        options_layout.addWidget(self.no_host_platform_checkbox)
-        options_layout.addWidget(self.include_debug_files_checkbox)
-        options_layout.addWidget(self.strict_checkbox)
-        options_layout.addWidget(self.unversioned_checkbox)
+        for attr, _ in self._OPTION_CHECKBOXES:
+            checkbox = QCheckBox(self.texts[attr])
+            setattr(self, attr, checkbox)
+            options_layout.addWidget(checkbox)
 
         # Additional parameters (string)
-        self.extra_params_label = QLabel(self.localize("extra_params_label", "Additional command line parameters:"))
+        self.extra_params_label = QLabel(self.texts["extra_params_label"])
         self.extra_params_edit = QLineEdit()
-        self.extra_params_edit.setPlaceholderText(self.localize("extra_params_placeholder", "-Param1=Value1 -Param2=Value2"))
+        self.extra_params_edit.setPlaceholderText(self.texts["extra_params_placeholder"])
 
         # Add all to layout
         form_layout = QFormLayout()
@@ -150,8 +199,6 @@ class AdvancedOptionsDialog(QDialog):
 
         params_layout.addLayout(form_layout)
 
-        return params_group
-
     def apply_language(self) -> None:
         """
         Apply selected language
@@ -161,11 +208,21 @@ class AdvancedOptionsDialog(QDialog):
             lang_code = self.language_combo.itemData(current_index)
             if lang_code and lang_code != self.localization.current_language:
                 self.localization.set_language(lang_code)
-                QMessageBox.information(
-                    self,
+                self.show_information(
                     "Information",
                     "Language changed. Please restart the application for full effect.")
 
+    def show_information(self, title: str, text: str) -> None:
+        """
+        Show information message without blocking the event loop
+
+        :param title: Message box title
+        :param text: Message text
+        """
+        message_box = QMessageBox(QMessageBox.Information, title, text, QMessageBox.Ok, self)
+        message_box.setAttribute(Qt.WA_DeleteOnClose)
+        message_box.open()
+
     def add_unreal_engine(self) -> None:
         """
         Manually add Unreal Engine installation
@@ -200,61 +257,69 @@ class AdvancedOptionsDialog(QDialog):
         """
         if hasattr(self.parent_window, "find_engines_forced"):
             self.parent_window.find_engines_forced()
-            QMessageBox.information(
-                self,
+            self.show_information(
                 self.localize("rescan_title", "Scanning Engines"),
                 self.localize("rescan_message", "Unreal Engine scanning started."))
         elif hasattr(self.parent_window, "find_engines"):
             # Fallback to regular find_engines if forced method not available
             self.parent_window.find_engines()
-            QMessageBox.information(
-                self,
+            self.show_information(
                 self.localize("rescan_title", "Scanning Engines"),
                 self.localize("rescan_message", "Unreal Engine scanning started."))
 
-    def get_build_options(self) -> Dict[str, Any]:
+    def set_build_options(self, options: Dict[str, Any]) -> None:
         """
-        Get selected build options
+        Restore dialog state from build options returned by get_build_options
+
+        :param options: Build options
         """
-        options = {}
+        # Checkboxes must exist before they can be set
+        self.populate_groups()
 
-        # Add selected platforms
-        selected_platforms = []
+        platforms = options.get("TargetPlatforms")
+        selected_platforms = set(platforms.split("+")) if isinstance(platforms, str) else set()
         for platform, checkbox in self.platform_checkboxes.items():
-            if checkbox.isChecked():
-                selected_platforms.append(platform)
+            checkbox.setChecked(platform in selected_platforms)
 
-        if selected_platforms:
-            options["TargetPlatforms"] = "+".join(selected_platforms)
+        flags = set()
+        for attr, key in self._OPTION_CHECKBOXES:
+            getattr(self, attr).setChecked(key in options)
+            flags.add(key)
 
-        # Add other options
-        if self.create_dist_checkbox.isChecked():
-            options["CreateSubFolder"] = True
+        # Everything else came from the custom parameters
+        extra_params = []
+        for key, value in options.items():
+            if key == "TargetPlatforms" or key in flags:
+                continue
+            extra_params.append(f"-{key}" if value is True else f"-{key}={value}")
+        self.extra_params_edit.setText(" ".join(extra_params))
 
-        if self.no_host_platform_checkbox.isChecked():
-            options["NoHostPlatform"] = True
+    def get_build_options(self) -> Dict[str, Any]:
+        """
+        Get selected build options
+        """
+        # Options are read from the checkboxes, make sure they exist
+        self.populate_groups()
 
-        if self.include_debug_files_checkbox.isChecked():
-            options["IncludeDebugFiles"] = True
+        options = {}
 
-        if self.strict_checkbox.isChecked():
-            options["Strict"] = True
+        # Add selected platforms
+        selected_platforms = "+".join(
+            platform for platform, checkbox in self.platform_checkboxes.items() if checkbox.isChecked())
+        if selected_platforms:
+            options["TargetPlatforms"] = selected_platforms
 
-        if self.unversioned_checkbox.isChecked():
-            options["Unversioned"] = True
+        # Add other options
+        for attr, key in self._OPTION_CHECKBOXES:
+            if getattr(self, attr).isChecked():
+                options[key] = True
 
         # Add custom parameters
         extra_params = self.extra_params_edit.text().strip()
         if extra_params:
             # Simple parsing of -Param=Value or -Flag
-            params = extra_params.split()
-            for param in params:
-                if param.startswith("-"):
-                    param = param[1:]  # Remove leading -
-                    if "=" in param:
-                        key, value = param.split("=", 1)
-                        options[key] = value
-                    else:
-                        options[param] = True
+            for match in _EXTRA_PARAM_RE.finditer(extra_params):
+                key, value = match.groups()
+                options[key] = value if value is not None else True
 
         return options
\ No newline at end of file
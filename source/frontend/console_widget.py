@@ -1,93 +1,209 @@
-from PySide6.QtWidgets import QTextEdit, QWidget
+from PySide6.QtWidgets import QPlainTextEdit, QWidget
 from PySide6.QtGui import QTextCharFormat, QColor, QTextCursor, QSyntaxHighlighter, QFont, QTextDocument
-from PySide6.QtCore import QRegularExpression, QTimer
+from PySide6.QtCore import QRegularExpression, QTimer, QObject, QThread, QCoreApplication, Signal, Slot
 
-from typing import Optional
+import re
+import sys
+from typing import Optional, Dict, List, Tuple
 
 from source.frontend.localization import LocalizationManager
 
+# Message already starts with a "[TAG]" prefix; bounded so long lines are never scanned in full
+_TAG_PREFIX_RE = re.compile(r"^\[[^\]]{1,16}\]")
+
+
+def _stop_thread(thread: QThread) -> None:
+    """
+    Quit the event loop of a thread and wait until it finishes
+    """
+    if thread.isRunning():
+        thread.quit()
+        thread.wait()
+
 
 class ConsoleHighlighter(QSyntaxHighlighter):
     """
     Syntax highlighter for the console
     """
 
+    # Block state for lines inserted with all their formats already applied
+    RENDERED_STATE = 1
+
+    # Log level rules, in priority order
+    LEVEL_PATTERNS = (
+        ("error", r"\[(?:ERROR|ОШИБКА)\][^\r\n]*|\b(?:error|ошибка|failed)\b"),
+        ("warning", r"\[(?:WARNING|ПРЕДУПРЕЖДЕНИЕ)\][^\r\n]*|\b(?:warning|предупреждение)\b"),
+        ("success", r"\[(?:SUCCESS|УСПЕХ)\][^\r\n]*|\b(?:success|успешно|completed)\b"),
+        ("info", r"\[(?:INFO|ИНФО)\][^\r\n]*"),
+    )
+
+    # Command and path rules are applied on top of the log level colors
+    COMMAND_PATTERN = r"RunUAT|BuildPlugin"
+    PATH_PATTERN = r"[A-Za-z]:\\(?:[^\\/:*?\"<>|\r\n]+\\)*[^\\/:*?\"<>|\r\n]*|\.uplugin|\.bat"
+
+    # Substrings that any path rule match must contain
+    PATH_MARKERS = (":\\", ".uplugin", ".bat")
+
+    # Rule colors
+    COLORS = {
+        "error": QColor("#FF5252"),  # red
+        "warning": QColor("#FFA726"),  # orange
+        "success": QColor("#66BB6A"),  # green
+        "info": QColor("#42A5F5"),  # blue
+        "command": QColor("#BA68C8"),  # purple
+        "path": QColor("#4DB6AC"),  # teal
+    }
+
+    # Character formats shared by all highlighters, created on first use
+    _formats: Optional[Dict[str, QTextCharFormat]] = None
+
     def __init__(self, document: QTextDocument, localization: Optional[LocalizationManager] = None) -> None:
         super().__init__(document)
         self.localization = localization
         self.highlighting_rules = []
         self.setup_highlighting_rules()
 
+    @classmethod
+    def _get_formats(cls) -> Dict[str, QTextCharFormat]:
+        """
+        Get shared character formats for all rules
+
+        :return: Dictionary of rule name -> format
+        """
+        if cls._formats is None:
+            formats = {}
+            for name, color in cls.COLORS.items():
+                format = QTextCharFormat()
+                format.setForeground(color)
+                formats[name] = format
+            cls._formats = formats
+        return cls._formats
+
     def setup_highlighting_rules(self) -> None:
         """
         Set up syntax highlighting rules
         """
-        # Error format (red)
-        error_format = QTextCharFormat()
-        error_format.setForeground(QColor("#FF5252"))
-
-        error_pattern = r"\[ERROR\].*|\[ОШИБКА\].*|(^|\s)error(\s|$)|(^|\s)ошибка(\s|$)|(^|\s)failed(\s|$)"
-        self.highlighting_rules.append((QRegularExpression(error_pattern), error_format))
+        formats = self._get_formats()
 
-        # Warning format (orange)
-        warning_format = QTextCharFormat()
-        warning_format.setForeground(QColor("#FFA726"))
+        # Log level rules are fused into one pattern with a named group per level,
+        # so each block is scanned once for all of them
+        # Word boundaries need Unicode properties to work for Cyrillic keywords
+        self.level_pattern = QRegularExpression(
+            "|".join(f"(?<{name}>{pattern})" for name, pattern in self.LEVEL_PATTERNS),
+            QRegularExpression.CaseInsensitiveOption
+            | QRegularExpression.DontCaptureOption
+            | QRegularExpression.UseUnicodePropertiesOption)
+        self.group_formats = [(name, formats[name]) for name, _ in self.LEVEL_PATTERNS]
 
-        warning_pattern = r"\[WARNING\].*|\[ПРЕДУПРЕЖДЕНИЕ\].*|(^|\s)warning(\s|$)|(^|\s)предупреждение(\s|$)"
-        self.highlighting_rules.append((QRegularExpression(warning_pattern), warning_format))
+        self.highlighting_rules.append((QRegularExpression(self.COMMAND_PATTERN), formats["command"]))
 
-        # Success format (green)
-        success_format = QTextCharFormat()
-        success_format.setForeground(QColor("#66BB6A"))
-
-        success_pattern = r"\[SUCCESS\].*|\[УСПЕХ\].*|(^|\s)success(\s|$)|(^|\s)успешно(\s|$)|(^|\s)completed(\s|$)"
-        self.highlighting_rules.append((QRegularExpression(success_pattern), success_format))
-
-        # Info format (blue)
-        info_format = QTextCharFormat()
-        info_format.setForeground(QColor("#42A5F5"))
-
-        info_pattern = r"\[INFO\].*|\[ИНФО\].*"
-        self.highlighting_rules.append((QRegularExpression(info_pattern), info_format))
-
-        # Command format (purple)
-        command_format = QTextCharFormat()
-        command_format.setForeground(QColor("#BA68C8"))
-
-        command_pattern = r"RunUAT|BuildPlugin"
-        self.highlighting_rules.append((QRegularExpression(command_pattern), command_format))
-
-        # Path format (teal)
-        path_format = QTextCharFormat()
-        path_format.setForeground(QColor("#4DB6AC"))
-
-        path_pattern = r"[A-Za-z]:\\(?:[^\\/:*?\"<>|\r\n]+\\)*[^\\/:*?\"<>|\r\n]*|\.uplugin|\.bat"
-        self.highlighting_rules.append((QRegularExpression(path_pattern), path_format))
+        # Kept apart from the other rules so it only runs on lines that can contain a match
+        self.path_rule = (QRegularExpression(self.PATH_PATTERN), formats["path"])
 
     def highlightBlock(self, text: str) -> None:
         """
         Highlight a block of text
         """
+        # Lines rendered by the highlight worker are already formatted
+        if self.currentBlockState() == self.RENDERED_STATE:
+            return
+
+        match_iterator = self.level_pattern.globalMatch(text)
+        while match_iterator.hasNext():
+            match = match_iterator.next()
+            for name, format in self.group_formats:
+                start = match.capturedStart(name)
+                if start >= 0:
+                    self.setFormat(start, match.capturedLength(name), format)
+                    break
+
         for pattern, format in self.highlighting_rules:
             match_iterator = pattern.globalMatch(text)
             while match_iterator.hasNext():
                 match = match_iterator.next()
                 self.setFormat(match.capturedStart(), match.capturedLength(), format)
 
+        # Path rule is the most expensive one, skip it when no marker is present
+        if any(marker in text for marker in self.PATH_MARKERS):
+            pattern, format = self.path_rule
+            match_iterator = pattern.globalMatch(text)
+            while match_iterator.hasNext():
+                match = match_iterator.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+
 
-class ConsoleWidget(QTextEdit):
+class HighlightWorker(QObject):
+    """
+    Computes console highlight spans outside the GUI thread
+    """
+    # Generation, list of (text, base format name, spans or None)
+    ready = Signal(int, list)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.level_re = re.compile(
+            "|".join(f"(?P<{name}>{pattern})" for name, pattern in ConsoleHighlighter.LEVEL_PATTERNS),
+            re.IGNORECASE)
+        self.command_re = re.compile(ConsoleHighlighter.COMMAND_PATTERN)
+        self.path_re = re.compile(ConsoleHighlighter.PATH_PATTERN)
+
+    @Slot(int, list)
+    def process(self, generation: int, lines: list) -> None:
+        """
+        Compute spans for a batch of lines and emit them back
+
+        :param generation: Console generation the batch belongs to
+        :param lines: List of (text, base format name or None)
+        """
+        self.ready.emit(generation, [(text, base, self.get_spans(text, base)) for text, base in lines])
+
+    def get_spans(self, text: str, base: Optional[str]) -> Optional[List[Tuple[int, int, str]]]:
+        """
+        Compute highlight spans for a line
+
+        :param text: Line text
+        :param base: Format name of the whole line, None if the log level rules must be applied
+        :return: List of (start, length, format name) or None if the line must be left to the highlighter
+        """
+        # Document positions are UTF-16 code units, which differ from str indices past the BMP
+        if not text.isascii() and max(text) > "\uffff":
+            return None
+
+        spans = []
+        if base is None:
+            for match in self.level_re.finditer(text):
+                spans.append((match.start(), match.end() - match.start(), match.lastgroup))
+
+        for match in self.command_re.finditer(text):
+            spans.append((match.start(), match.end() - match.start(), "command"))
+
+        # Path rule is the most expensive one, skip it when no marker is present
+        if any(marker in text for marker in ConsoleHighlighter.PATH_MARKERS):
+            for match in self.path_re.finditer(text):
+                spans.append((match.start(), match.end() - match.start(), "path"))
+
+        return spans
+
+
+class ConsoleWidget(QPlainTextEdit):
     """
     Console widget with syntax highlighting
     """
+    # Generation, list of (text, base format name or None)
+    _highlight_requested = Signal(int, list)
 
-    def __init__(self, parent: Optional[QWidget] = None, localization: Optional[LocalizationManager] = None) -> None:
+    def __init__(self, parent: Optional[QWidget] = None, localization: Optional[LocalizationManager] = None,
+                 max_block_count: int = 20000) -> None:
         super().__init__(parent)
         self.localization = localization
 
         # Set up appearance
         self.setReadOnly(True)
+
+        # Drop the oldest lines on long builds to bound memory and layout time (0 - unlimited)
+        self.setMaximumBlockCount(max_block_count)
         self.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #2D2D30;
                 color: #CCCCCC;
                 border: 1px solid #3F3F46;
@@ -103,11 +219,43 @@ class ConsoleWidget(QTextEdit):
         # Create and apply syntax highlighting
         self.highlighter = ConsoleHighlighter(self.document(), localization)
 
+        self._formats = ConsoleHighlighter._get_formats()
+        self._plain_format = QTextCharFormat()
+
+        # Highlight spans are computed in a worker thread, the GUI thread only applies them.
+        # Batches from before the last clear are recognized by their generation and dropped
+        self._generation = 0
+        self._highlight_thread = QThread(self)
+        self._highlight_worker = HighlightWorker()
+        self._highlight_worker.moveToThread(self._highlight_thread)
+        self._highlight_requested.connect(self._highlight_worker.process)
+        self._highlight_worker.ready.connect(self._insert_highlighted)
+        self._highlight_thread.finished.connect(self._highlight_worker.deleteLater)
+        self._highlight_thread.start()
+
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.stop_highlight_thread)
+        # The thread is a child of the widget and must be stopped before the widget deletes it.
+        # destroyed is emitted before the children are deleted; the slot only holds the thread
+        thread = self._highlight_thread
+        self.destroyed.connect(lambda *_: _stop_thread(thread))
+
         # Buffer for adding text (for performance optimization)
         self.buffer = []
         self.buffer_timer = QTimer(self)
         self.buffer_timer.timeout.connect(self._flush_buffer)
         self.buffer_timer.setInterval(100)  # Update every 100ms
+        self._flush_threshold = 256  # Flush right away once this many lines are waiting
+
+        # Localized "[TAG] " prefixes per log type, rebuilt after a language change
+        self._prefix_cache: Dict[str, str] = {}
+        if localization:
+            localization.language_changed.connect(self.clear_prefix_cache)
+
+        # Follow new output while the view is scrolled to the bottom
+        self._auto_tail = True
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll)
 
     def append_text(self, message: str, log_type: Optional[str] = None) -> None:
         """
@@ -119,10 +267,25 @@ class ConsoleWidget(QTextEdit):
         # Add to buffer
         self.buffer.append((message, log_type))
 
+        # Flush large bursts immediately to keep each flush small
+        if len(self.buffer) >= self._flush_threshold:
+            self._flush_buffer()
+            return
+
         # Start timer if not already running
         if not self.buffer_timer.isActive():
             self.buffer_timer.start()
 
+    def append_block(self, text: str, log_type: Optional[str] = None) -> None:
+        """
+        Add several lines to the console at once, inserted as a single batch
+
+        :param text: Lines separated by newlines
+        :param log_type: Log type of every line (INFO, ERROR, WARNING, SUCCESS)
+        """
+        self.buffer.extend((line, log_type) for line in text.split("\n"))
+        self._flush_buffer()
+
     def _flush_buffer(self) -> None:
         """
         Output accumulated buffer to the console
@@ -131,43 +294,120 @@ class ConsoleWidget(QTextEdit):
             self.buffer_timer.stop()
             return
 
-        # Remember scroll position
-        scrollbar = self.verticalScrollBar()
-        at_bottom = scrollbar.value() == scrollbar.maximum()
-
-        # Set cursor at the end of text
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.setTextCursor(cursor)
-
-        # Add all messages from the buffer
+        lines = []
         for message, log_type in self.buffer:
-            # If log type is passed, add prefix with localized tag
-            if log_type and not (message.startswith("[") and "]" in message):
-                # Get localized log type tag
-                log_tag = f"log_{log_type.lower()}"
-                if self.localization:
-                    localized_log_type = self.localization(log_tag, log_type.upper())
-                else:
-                    localized_log_type = log_type.upper()
-
-                message = f"[{localized_log_type}] {message}"
+            base = None
+            # If log type is passed, add prefix with localized tag and color the whole line
+            if log_type and not _TAG_PREFIX_RE.match(message):
+                base = log_type.lower()
+                if base not in self._formats:
+                    base = None
+                message = self._get_prefix(log_type) + message
 
-            # Add text with line break
-            cursor.insertText(message + "\n")
+            lines.append((message, base))
 
         # Clear buffer
         self.buffer.clear()
 
+        self._highlight_requested.emit(self._generation, lines)
+
+    @Slot(int, list)
+    def _insert_highlighted(self, generation: int, lines: list) -> None:
+        """
+        Insert lines with spans computed by the highlight worker
+
+        :param generation: Console generation the batch belongs to
+        :param lines: List of (text, base format name, spans or None)
+        """
+        if generation != self._generation:
+            return
+
+        formats = self._formats
+
+        # Separate cursor at the end of text, so moving it does not scroll the view
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+
+        # Insert the whole batch in one edit block, so the document is laid out once per batch
+        self.setUpdatesEnabled(False)
+        cursor.beginEditBlock()
+        try:
+            for text, base, spans in lines:
+                start = cursor.position()
+                cursor.insertText(text, formats[base] if base else self._plain_format)
+
+                if spans is None:
+                    # Left to the syntax highlighter
+                    cursor.block().setUserState(-1)
+                else:
+                    for offset, length, name in spans:
+                        cursor.setPosition(start + offset)
+                        cursor.setPosition(start + offset + length, QTextCursor.KeepAnchor)
+                        cursor.setCharFormat(formats[name])
+                    cursor.movePosition(QTextCursor.End)
+                    cursor.block().setUserState(ConsoleHighlighter.RENDERED_STATE)
+                cursor.insertBlock()
+        finally:
+            cursor.endEditBlock()
+            self.setUpdatesEnabled(True)
+
         # Scroll to the end if console was at the bottom
-        if at_bottom:
+        if self._auto_tail:
+            scrollbar = self.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
 
+    def _on_scroll(self, value: int) -> None:
+        """
+        Track whether the view is scrolled to the bottom
+
+        :param value: New scroll bar value
+        """
+        self._auto_tail = value == self.verticalScrollBar().maximum()
+
+    def _get_prefix(self, log_type: str) -> str:
+        """
+        Get localized tag prefix for the log type
+
+        :param log_type: Log type (INFO, ERROR, WARNING, SUCCESS)
+        :return: Prefix in the form "[TAG] "
+        """
+        prefix = self._prefix_cache.get(log_type)
+        if prefix is None:
+            # Get localized log type tag
+            if self.localization:
+                localized_log_type = self.localization(f"log_{log_type.lower()}", log_type.upper())
+            else:
+                localized_log_type = log_type.upper()
+
+            prefix = sys.intern(f"[{localized_log_type}] ")
+            self._prefix_cache[log_type] = prefix
+        return prefix
+
+    def clear_prefix_cache(self, *_) -> None:
+        """
+        Drop cached log tag prefixes so they are localized again
+        """
+        self._prefix_cache.clear()
+
     def clear_console(self) -> None:
         """
         Clear console contents
         """
-        super().clear()
+        # Clear the document directly, dropping all blocks and their formats in one go
+        self.setUpdatesEnabled(False)
+        try:
+            self.document().clear()
+        finally:
+            self.setUpdatesEnabled(True)
         self.buffer.clear()
         if self.buffer_timer.isActive():
-            self.buffer_timer.stop()
\ No newline at end of file
+            self.buffer_timer.stop()
+
+        # Drop batches that are still being highlighted
+        self._generation += 1
+
+    def stop_highlight_thread(self) -> None:
+        """
+        Stop the highlight worker thread
+        """
+        _stop_thread(self._highlight_thread)
\ No newline at end of file
@@ -1,17 +1,17 @@
 import os
+from pathlib import PurePath
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QLineEdit, QPushButton, QRadioButton,
     QGroupBox, QFrame, QFileDialog, QDialog, QDialogButtonBox,
-    QMessageBox, QApplication, QSizePolicy
+    QMessageBox, QSizePolicy, QFormLayout
 )
-from PySide6.QtGui import QColor, QIcon, QDragEnterEvent, QDropEvent, QPainter, QPen, QBrush
-from PySide6.QtWidgets import QTextEdit
-from PySide6.QtCore import QEvent, QProcess, Qt
+from PySide6.QtGui import QColor, QIcon, QDragEnterEvent, QDropEvent, QPainter, QPen, QBrush, QPixmap
+from PySide6.QtCore import QEvent, QProcess, Qt, QRect, QSize, QLineF, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QPalette
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
-from source.backend.engine_finder import EngineFinder
+from source.backend.engine_finder import EngineFinder, version_tuple
 from source.frontend.console_widget import ConsoleWidget
 from source.frontend.advanced_options_dialog import AdvancedOptionsDialog
 from source.backend.plugin_builder import PluginBuilder
@@ -19,150 +19,465 @@ from source.frontend.localization import LocalizationManager
 from source.frontend.manual_engine_dialog import ManualEngineEntryDialog
 
 
-class PluginDragDropSupport:
+# Plugin descriptor suffix, as a tuple built once for str.endswith
+_UPLUGIN_SUFFIX = ('.uplugin',)
+
+# Stylesheets, built once at import instead of on every use
+_GROUP_QSS = """
+    QGroupBox {
+        background-color: #2D2D30;
+        border: 1px solid #3F3F46;
+        border-radius: 3px;
+        margin-top: 1ex; /* Space for the title */
+        font-weight: bold;
+        padding: 3px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 3px;
+        color: #CCCCCC;
+    }
+"""
+
+_CONSOLE_QSS = """
+    QFrame {
+        background-color: #252526;
+        border: 1px solid #3F3F46;
+        border-radius: 3px;
+    }
+"""
+
+_BUILD_BTN_QSS = """
+    QPushButton {
+        background-color: #0078D4;
+        color: white;
+        padding: 6px 12px;
+        font-weight: bold;
+        border-radius: 4px;
+        border: none;
+    }
+    QPushButton:hover {
+        background-color: #106EBE;
+    }
+    QPushButton:pressed {
+        background-color: #005A9E;
+    }
+"""
+
+# Build button while a build can be aborted, same metrics as _BUILD_BTN_QSS so the button keeps its size
+_ABORT_BUTTON_QSS = """
+    QPushButton {
+        background-color: #D13438;
+        color: white;
+        padding: 6px 12px;
+        font-weight: bold;
+        border-radius: 4px;
+        border: none;
+    }
+    QPushButton:hover {
+        background-color: #C50F1F;
+    }
+    QPushButton:pressed {
+        background-color: #A80000;
+    }
+"""
+
+# Plugin information rows: (field, localization key, default label, field that must be set to show the row)
+_PLUGIN_INFO_FIELDS = (
+    ("name", "plugin_info_name", "Name:", None),
+    ("version", "plugin_info_version", "Version:", None),
+    ("category", "plugin_info_category", "Category:", None),
+    ("description", "plugin_info_description", "Description:", None),
+    ("modules", "plugin_info_modules", "Modules:", None),
+    ("engine_version", "plugin_info_engine_version", "Engine Version:", "is_engine_plugin"),
+    ("marketplace_url", "plugin_info_marketplace_url", "Marketplace URL:", "marketplace_url"),
+    ("supported_platforms", "plugin_info_supported_platforms", "Supported Platforms:", "supported_platforms"),
+)
+
+
+def _first_uplugin(path: str) -> Optional[str]:
+    """
+    Return path to the first .uplugin file in a folder
+
+    :param path: Folder to scan, only until the first match
+    :return: Full path to the .uplugin file, or None if there is none or the folder cannot be read
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(_UPLUGIN_SUFFIX):
+                    return entry.path
+    except OSError:
+        # Not a folder, or it cannot be read
+        pass
+    return None
+
+
+def _probe_uplugin(path: str) -> Tuple[str, Optional[str]]:
     """
-    Mixin to add drag and drop support to the plugin group box
+    Check whether a dragged path is a plugin
+
+    :param path: Dragged file or folder
+    :return: ('file' | 'dir-with-uplugin' | 'invalid', path to .uplugin file or None)
+    """
+    if path.endswith(_UPLUGIN_SUFFIX):
+        return 'file', path
+
+    plugin_path = _first_uplugin(path)
+    if plugin_path is None:
+        return 'invalid', None
+    return 'dir-with-uplugin', plugin_path
+
+
+# Defaults of strings used by event handlers, looked up through MainWindow.T
+_RUNTIME_STRINGS = {
+    "error_title": "Error",
+    "build_button": "Build Plugin",
+    "abort_button": "Abort Build",
+    "log_build_start": "Starting plugin build...",
+    "cancel_build_title": "Cancel Build?",
+    "cancel_build_message": "Are you sure you want to cancel the current build?",
+    "build_cancelled": "Build cancelled by user",
+    "cancel_failed": "No active build process to cancel.",
+    "build_success_title": "Build Complete",
+    "help_start": "Getting BuildPlugin help...",
+    "help_header": "=== BuildPlugin Help ===",
+    "help_footer": "=== End of Help ===",
+    "command_dialog_title": "Build Command",
+    "command_label": "Command to run in command line:",
+    "plugin_info_empty": "No information. Please select a plugin...",
+    "plugin_info_error": "Error reading plugin information.",
+}
+
+
+class _LocProxy:
+    """
+    Localized strings as attributes (T.error_title), resolved once per localization version
+    """
+    __slots__ = ("_loc", "_cache", "_version")
+
+    def __init__(self, localization: Optional[LocalizationManager]):
+        self._loc = localization
+        self._cache: Dict[str, str] = {}
+        self._version = None
+
+    def __getattr__(self, key: str) -> str:
+        default = _RUNTIME_STRINGS.get(key)
+        if default is None:
+            raise AttributeError(key)
+        if self._loc is None:
+            return default
+
+        # Drop strings of the previous language
+        if self._loc.loc_version != self._version:
+            self._cache.clear()
+            self._version = self._loc.loc_version
+
+        text = self._cache.get(key)
+        if text is None:
+            text = self._cache[key] = self._loc(key, default)
+        return text
+
+
+class UPluginProbeSignals(QObject):
+    """
+    Signals for UPluginProbe class
+    """
+    finished = Signal(int, str, str, object)  # (sequence number, path, kind, plugin path or None)
+
+
+class UPluginProbe(QRunnable):
+    """
+    Probe a dragged path on the global thread pool, so slow folders don't block painting
+    """
+
+    def __init__(self, path: str, seq: int, signals: UPluginProbeSignals):
+        super().__init__()
+        self.path = path
+        self.seq = seq
+        self.signals = signals
+
+    def run(self) -> None:
+        kind, plugin_path = _probe_uplugin(self.path)
+        self.signals.finished.emit(self.seq, self.path, kind, plugin_path)
+
+
+class _FindRunnable(QRunnable):
+    """
+    Search for installed Unreal Engines on the global thread pool
+    """
+
+    def __init__(self, finder: EngineFinder, force: bool):
+        super().__init__()
+        self.finder = finder
+        self.force = force
+
+    def run(self) -> None:
+        engines = self.finder.find_all_engines(force_rescan=self.force)
+        self.finder.signals.engines_found.emit(engines)
+
+
+class _DragOverlay(QWidget):
+    """
+    Transparent child widget painting the drag state on top of the plugin group box
+    """
+
+    def __init__(self, parent: QWidget, drag_filter: "PluginDragDropFilter"):
+        super().__init__(parent)
+        self.drag_filter = drag_filter
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet("background-color: transparent;")
+        self.hide()
+
+    def paintEvent(self, event) -> None:
+        self.drag_filter.paint_overlay(self)
+
+
+class PluginDragDropFilter(QObject):
+    """
+    Event filter adding drag and drop support to the plugin group box
     """
 
     def __init__(self, widget, plugin_path_edit, update_callback):
+        super().__init__(widget)
         self.target_widget = widget
         self.plugin_path_edit = plugin_path_edit
         self.update_callback = update_callback
         self.isDragging = False
+        # Whether the current drag carries URLs, set on drag enter
+        self._drag_has_urls = False
+        # True / False once the dragged path is probed, None while the probe is running
         self.isValidDrag = False
+        # Bumped on every drag enter, leave and drop, so results of old probes are ignored
+        self._probe_seq = 0
+        self._probe_signals = UPluginProbeSignals()
+        self._probe_signals.finished.connect(self._on_probe_done)
+        # Probe results of dragged paths, kept until the drag leaves or drops
+        self._drag_cache: Dict[str, Tuple[str, Optional[str]]] = {}
+
+        # Overlay showing the highlight and the X while dragging, created on the first drag
+        self.overlay: Optional[_DragOverlay] = None
+
+        # Drag feedback rasterized once per widget size, painting only blits these
+        self._pixmap_size = QSize()
+        self._x_pix = None
+        self._border_pixmaps = {}
+
+        # Handled event types, all other events go to the widget untouched
+        self._handlers = {
+            QEvent.DragEnter: self.dragEnterEvent,
+            QEvent.DragMove: self.dragMoveEvent,
+            QEvent.DragLeave: self.dragLeaveEvent,
+            QEvent.Drop: self.dropEvent,
+        }
 
-        # Create an overlay widget for the X
-        from PySide6.QtWidgets import QWidget
-        self.overlay = QWidget(self.target_widget)
-        self.overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.overlay.setStyleSheet("background-color: transparent;")
-        self.overlay.hide()
-
-        # Create custom paint method for overlay
-        def paintOverlay(event):
-            if not self.isValidDrag:
-                painter = QPainter(self.overlay)
-                painter.setRenderHint(QPainter.Antialiasing)
-
-                # Draw X
-                painter.setPen(QPen(QColor("#F44336"), 3))
-                size = min(50, min(self.overlay.width(), self.overlay.height()) / 4)
-                x = (self.overlay.width() - size) / 2
-                y = (self.overlay.height() - size) / 2
-                painter.drawLine(x, y, x + size, y + size)
-                painter.drawLine(x + size, y, x, y + size)
-
-        # Assign custom paint method to overlay
-        self.overlay.paintEvent = paintOverlay
-
-        # Install event filter
         self.target_widget.setAcceptDrops(True)
-        self.target_widget.dragEnterEvent = self.dragEnterEvent
-        self.target_widget.dragLeaveEvent = self.dragLeaveEvent
-        self.target_widget.dragMoveEvent = self.dragMoveEvent
-        self.target_widget.dropEvent = self.dropEvent
-        self.target_widget.paintEvent_original = self.target_widget.paintEvent
-        self.target_widget.paintEvent = self.paintEvent
+
+    def eventFilter(self, obj, event) -> bool:
+        """
+        Handle drag and drop events of the target widget
+        """
+        handler = self._handlers.get(event.type())
+        if handler is None or obj is not self.target_widget:
+            return False
+        handler(event)
+        return True
+
+    def _ensure_overlay(self) -> None:
+        """
+        Create the overlay widget on first use
+        """
+        if self.overlay is None:
+            self.overlay = _DragOverlay(self.target_widget, self)
+
+    def probe_path(self, path: str) -> Tuple[str, Optional[str]]:
+        """
+        Probe dragged path, cached until the drag leaves the widget
+
+        :param path: Dragged file or folder
+        :return: Result of _probe_uplugin
+        """
+        result = self._drag_cache.get(path)
+        if result is None:
+            # Probe did not finish yet, check synchronously
+            result = _probe_uplugin(path)
+            self._drag_cache[path] = result
+        return result
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Handle drag enter event"""
-        # Check if the drag has URLs (files/folders)
-        if event.mimeData().hasUrls():
+        self._probe_seq += 1
+
+        # Check if the drag has URLs (files/folders), the answer holds for the whole drag
+        self._drag_has_urls = event.mimeData().hasUrls()
+        if self._drag_has_urls:
             # Get the first URL
             url = event.mimeData().urls()[0]
             path = url.toLocalFile()
 
-            # Check if it's a directory
-            if os.path.isdir(path):
-                # Check if directory contains a .uplugin file
-                try:
-                    uplugin_files = [f for f in os.listdir(path) if f.endswith('.uplugin')]
-                    if uplugin_files:
-                        self.isValidDrag = True
-                        event.acceptProposedAction()
-                    else:
-                        # Directory doesn't contain uplugin file
-                        self.isValidDrag = False
-                        event.acceptProposedAction()  # Still accept to show feedback
-                except (PermissionError, FileNotFoundError):
-                    self.isValidDrag = False
-            elif path.endswith('.uplugin'):
-                # Direct uplugin file
-                self.isValidDrag = True
-                event.acceptProposedAction()
+            result = self._drag_cache.get(path)
+            if result is None:
+                # Show neutral state until the probe finishes
+                self.isValidDrag = None
+                QThreadPool.globalInstance().start(UPluginProbe(path, self._probe_seq, self._probe_signals))
             else:
-                self.isValidDrag = False
+                self.isValidDrag = result[0] != 'invalid'
+            # Invalid drags are accepted too, to show feedback until the drag leaves
+            event.acceptProposedAction()
 
         self.isDragging = True
 
         # Resize and show overlay
+        self._ensure_overlay()
         self.overlay.resize(self.target_widget.size())
         self.overlay.show()
-        self.overlay.raise_()  # Ensure it's on top
+        self.overlay.raise_()  # Ensure it's on top (show() already schedules its repaint)
 
-        self.target_widget.update()
-        self.overlay.update()
+        self.update_border()
+
+    def _on_probe_done(self, seq: int, path: str, kind: str, plugin_path: Optional[str]) -> None:
+        """
+        Apply result of a background probe
+
+        :param seq: Sequence number the probe was started with
+        :param path: Probed path
+        :param kind: Kind of the path
+        :param plugin_path: Path to .uplugin file or None
+        """
+        if seq != self._probe_seq:
+            # Drag already left or dropped
+            return
+
+        self._drag_cache[path] = (kind, plugin_path)
+        self.isValidDrag = kind != 'invalid'
+        # The X is drawn inside the highlight rectangle, so this repaints both
+        self.update_border()
 
     def dragLeaveEvent(self, event) -> None:
         """Handle drag leave event"""
+        self._probe_seq += 1
         self.isDragging = False
-        self.overlay.hide()
-        self.target_widget.update()
+        self._drag_has_urls = False
+        self._drag_cache.clear()
+        # Hiding the overlay repaints the area it covered
+        if self.overlay is not None:
+            self.overlay.hide()
 
     def dragMoveEvent(self, event) -> None:
         """Handle drag move event"""
-        if event.mimeData().hasUrls():
+        # Keep accepting while the probe is running, refuse once the drag is known to be invalid
+        if self._drag_has_urls and self.isValidDrag is not False:
             event.acceptProposedAction()
+        else:
+            event.ignore()
 
     def dropEvent(self, event: QDropEvent) -> None:
         """Handle drop event"""
+        self._probe_seq += 1
         self.isDragging = False
-        self.overlay.hide()
+        if self.overlay is not None:
+            self.overlay.hide()
 
         if event.mimeData().hasUrls():
             url = event.mimeData().urls()[0]
-            path = url.toLocalFile()
+            _, plugin_path = self.probe_path(url.toLocalFile())
 
-            if os.path.isdir(path):
-                # Find .uplugin file in directory
-                try:
-                    uplugin_files = [f for f in os.listdir(path) if f.endswith('.uplugin')]
-                    if uplugin_files:
-                        # Use the first .uplugin file found
-                        plugin_path = os.path.join(path, uplugin_files[0])
-                        self.plugin_path_edit.setText(plugin_path)
-                        if self.update_callback:
-                            self.update_callback()
-                except (PermissionError, FileNotFoundError):
-                    pass
-            elif path.endswith('.uplugin'):
-                # Direct .uplugin file
-                self.plugin_path_edit.setText(path)
+            if plugin_path:
+                self.plugin_path_edit.setText(plugin_path)
                 if self.update_callback:
                     self.update_callback()
 
-        self.target_widget.update()
+        self._drag_has_urls = False
+        self._drag_cache.clear()
 
-    def paintEvent(self, event) -> None:
-        """Custom paint event to show drag state"""
-        # Call the original paint event first
-        self.target_widget.paintEvent_original(event)
+    def border_rect(self) -> QRect:
+        """
+        Return rectangle of the drag state highlight
+        """
+        return self.target_widget.rect().adjusted(2, 2, -2, -2)
+
+    def update_border(self) -> None:
+        """
+        Schedule repaint of the drag state highlight only, including its 2px pen
+        """
+        if self.overlay is not None:
+            self.overlay.update(self.border_rect().adjusted(-1, -1, 1, 1))
+
+    def _create_pixmap(self, width: int, height: int) -> QPixmap:
+        """
+        Return transparent pixmap for the screen of the target widget
+        """
+        ratio = self.target_widget.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def _ensure_pixmaps(self) -> None:
+        """
+        Rebuild cached drag feedback pixmaps if the widget size changed
+        """
+        size = self.target_widget.size()
+        if size != self._pixmap_size:
+            self._rebuild_pixmaps(size)
+
+    def _rebuild_pixmaps(self, size: QSize) -> None:
+        """
+        Rasterize the red X and the highlight rectangles for a widget size
 
-        if self.isDragging:
-            painter = QPainter(self.target_widget)
+        :param size: Size of the target widget
+        """
+        self._pixmap_size = QSize(size)
+        width, height = size.width(), size.height()
+
+        # Red X, sized as before relative to the widget
+        x_size = min(50, min(width, height) / 4)
+        self._x_pix = self._create_pixmap(int(x_size) + 4, int(x_size) + 4)
+        painter = QPainter(self._x_pix)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor("#F44336"), 3))
+        painter.drawLine(QLineF(2, 2, 2 + x_size, 2 + x_size))
+        painter.drawLine(QLineF(2 + x_size, 2, 2, 2 + x_size))
+        painter.end()
+
+        # Highlight rectangles by drag state: probe running, valid, invalid
+        border_rect = self.border_rect()
+        self._border_pixmaps = {}
+        for state, pen_color, brush_color in (
+                (None, QColor("#8A8A8A"), QColor(138, 138, 138, 40)),
+                (True, QColor("#4CAF50"), QColor(76, 175, 80, 40)),
+                (False, QColor("#F44336"), QColor(244, 67, 54, 40)),
+        ):
+            pixmap = self._create_pixmap(width, height)
+            painter = QPainter(pixmap)
             painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(pen_color, 2))
+            painter.setBrush(QBrush(brush_color))
+            painter.drawRect(border_rect)
+            painter.end()
+            self._border_pixmaps[state] = pixmap
 
-            if self.isValidDrag:
-                # Valid drop target - show green highlight
-                painter.setPen(QPen(QColor("#4CAF50"), 2))
-                painter.setBrush(QBrush(QColor(76, 175, 80, 40)))
-            else:
-                # Invalid drop target - show red background
-                painter.setPen(QPen(QColor("#F44336"), 2))
-                painter.setBrush(QBrush(QColor(244, 67, 54, 40)))
+    def paint_overlay(self, overlay: QWidget) -> None:
+        """
+        Paint drag state on the overlay
 
-            # Draw filled rectangle with border
-            painter.drawRect(2, 2, self.target_widget.width() - 4, self.target_widget.height() - 4)
+        :param overlay: Overlay widget being painted
+        """
+        if not self.isDragging:
+            # Drag already ended, nothing to draw
+            return
+
+        self._ensure_pixmaps()
+        painter = QPainter(overlay)
+        # Neutral while the probe is running, green for a valid drop target, red otherwise
+        painter.drawPixmap(0, 0, self._border_pixmaps[self.isValidDrag])
+
+        if self.isValidDrag is False:
+            ratio = self._x_pix.devicePixelRatio()
+            x = (overlay.width() - self._x_pix.width() / ratio) / 2
+            y = (overlay.height() - self._x_pix.height() / ratio) / 2
+            painter.drawPixmap(int(x), int(y), self._x_pix)
 
 
 class MainWindow(QMainWindow):
@@ -180,8 +495,28 @@ class MainWindow(QMainWindow):
         self.engine_paths = engine_paths or {}
         self.localization = localization
         self.plugin_builder = PluginBuilder(localization)
+        # Strings used by event handlers, see _RUNTIME_STRINGS
+        self.T = _LocProxy(localization)
         self.engine_finder = finder
         self.advanced_options = {}
+        # Localized plain strings by (language, key, default)
+        self._loc_cache: Dict[Tuple[str, str, Optional[str]], str] = {}
+        # Advanced options dialog, kept between openings, and the localization version it was created with
+        self._adv_dialog: Optional[AdvancedOptionsDialog] = None
+        self._adv_dialog_version = 0
+        # Whether advanced_options came from the dialog, rather than being the initial empty options
+        self._adv_options_accepted = False
+        # Last result of get_output_path and the inputs it was computed from
+        self._output_path_key: Optional[tuple] = None
+        self._output_path = ""
+        # Mode set by switch_build_button_state, None until the first switch
+        self._current_button_mode: Optional[str] = None
+        # Engine path by target version combo box text, filled with the combo box
+        self._combo_to_engine_path: Dict[str, Optional[str]] = {}
+        # Hash of the engines shown in the target version combo box
+        self._engines_hash: Optional[int] = None
+        # Plugin information by (path, modification time), so version changes and edits don't re-read the file
+        self._plugin_info_cache: Dict[Tuple[str, int], Optional[dict]] = {}
 
         # Set up backend signals
         self.plugin_builder.signals.log_message.connect(self.handle_log_message)
@@ -189,6 +524,8 @@ class MainWindow(QMainWindow):
         self.plugin_builder.signals.build_finished.connect(self.handle_build_finished)
 
         self.engine_finder.signals.log_message.connect(self.handle_log_message)
+        # Emitted from the search thread, handled in the GUI thread
+        self.engine_finder.signals.engines_found.connect(self.update_engines_list, Qt.QueuedConnection)
 
         # Initialize UI
         self.init_ui()
@@ -202,7 +539,14 @@ class MainWindow(QMainWindow):
         Get localized text
         """
         if self.localization:
-            return self.localization(key, default, **kwargs)
+            if kwargs:
+                return self.localization(key, default, **kwargs)
+            # Plain strings are cached per language, the cache is cleared on language change
+            cache_key = (self.localization.current_language, key, default)
+            text = self._loc_cache.get(cache_key)
+            if text is None:
+                text = self._loc_cache[cache_key] = self.localization(key, default)
+            return text
         return default if default is not None else key
 
     def init_ui(self) -> None:
@@ -231,7 +575,8 @@ class MainWindow(QMainWindow):
 
         # === LEFT COLUMN: Plugin ===
         plugin_group = QGroupBox(self.localize("plugin_group", "Plugin"))
-        plugin_group.setStyleSheet(self.get_group_style())
+        plugin_group.setStyleSheet(_GROUP_QSS)
+        self.plugin_group = plugin_group
         plugin_layout = QVBoxLayout(plugin_group)
         plugin_layout.setContentsMargins(5, 15, 5, 5)
         plugin_layout.setSpacing(5)
@@ -241,7 +586,13 @@ class MainWindow(QMainWindow):
         plugin_label = QLabel(self.localize("plugin_file_label", "Select .uplugin file:"))
         self.plugin_path_edit = QLineEdit()
         self.plugin_path_edit.setPlaceholderText(self.localize("plugin_path_placeholder", "Path to plugin file..."))
-        self.plugin_path_edit.textChanged.connect(self.update_plugin_info)
+        # Read plugin information only once typing or pasting settles
+        self._path_debounce = QTimer(self)
+        self._path_debounce.setSingleShot(True)
+        self._path_debounce.setInterval(150)
+        self._path_debounce.timeout.connect(self.update_plugin_info)
+        # Lambdas, so the signal arguments are not passed to QTimer.start as an interval
+        self.plugin_path_edit.textChanged.connect(lambda text: self._path_debounce.start())
 
         plugin_file_button = QPushButton("...")
         plugin_file_button.setFixedWidth(30)
@@ -258,12 +609,38 @@ class MainWindow(QMainWindow):
         # Plugin information - SEPARATE LABEL from content (as in Image 2)
         plugin_info_label = QLabel(self.localize("plugin_info_label", "Plugin Information:"))
 
-        # Plugin info text as a separate widget with its own background
+        # Plugin info as a separate widget with its own background
+        self.plugin_info_frame = QFrame()
+        self.plugin_info_frame.setObjectName("plugin_info_frame")
+        self.plugin_info_frame.setStyleSheet("""
+            #plugin_info_frame { background-color: #383838; border-radius: 4px; }
+            #plugin_info_field { font-weight: bold; }
+        """)
+        self.plugin_info_frame.setMinimumHeight(80)  # Ensure there's enough vertical space
+        plugin_info_layout = QVBoxLayout(self.plugin_info_frame)
+        plugin_info_layout.setContentsMargins(5, 5, 5, 5)
+
+        # Message shown instead of the fields when there is no information
         self.plugin_info_text = QLabel(self.localize("plugin_info_empty", "No information. Please select a plugin..."))
-        self.plugin_info_text.setStyleSheet("background-color: #383838; padding: 5px; border-radius: 4px;")
         self.plugin_info_text.setWordWrap(True)
-        self.plugin_info_text.setTextFormat(Qt.RichText)
-        self.plugin_info_text.setMinimumHeight(80)  # Ensure there's enough vertical space
+        self.plugin_info_text.setTextFormat(Qt.PlainText)
+        plugin_info_layout.addWidget(self.plugin_info_text)
+
+        # One plain text label per field, so updates don't go through the rich text parser
+        plugin_info_form = QFormLayout()
+        plugin_info_form.setContentsMargins(0, 0, 0, 0)
+        self._plugin_info_rows: Dict[str, Tuple[QLabel, QLabel]] = {}
+        for field, key, default, _ in _PLUGIN_INFO_FIELDS:
+            field_label = QLabel(self.localize(key, default))
+            field_label.setObjectName("plugin_info_field")
+            value_label = QLabel()
+            value_label.setTextFormat(Qt.PlainText)
+            value_label.setWordWrap(True)
+            field_label.hide()
+            value_label.hide()
+            plugin_info_form.addRow(field_label, value_label)
+            self._plugin_info_rows[field] = (field_label, value_label)
+        plugin_info_layout.addLayout(plugin_info_form)
 
         # Add warning label for version match at the bottom of plugin info section
         self.version_match_warning = QLabel(
@@ -275,15 +652,16 @@ class MainWindow(QMainWindow):
         plugin_layout.addLayout(plugin_file_layout)
         plugin_layout.addWidget(drag_drop_hint)
         plugin_layout.addWidget(plugin_info_label)
-        plugin_layout.addWidget(self.plugin_info_text)
+        plugin_layout.addWidget(self.plugin_info_frame)
         plugin_layout.addWidget(self.version_match_warning)
 
         # Enable drag & drop for the plugin group
-        self.plugin_drag_drop = PluginDragDropSupport(
+        self.plugin_drag_drop = PluginDragDropFilter(
             plugin_group,
             self.plugin_path_edit,
             self.update_plugin_info
         )
+        plugin_group.installEventFilter(self.plugin_drag_drop)
 
         # === RIGHT COLUMN: Unreal Engine + Output Directory ===
         right_column = QVBoxLayout()
@@ -291,7 +669,8 @@ class MainWindow(QMainWindow):
 
         # Create Unreal Engine section
         engine_group = QGroupBox(self.localize("engine_group", "Unreal Engine"))
-        engine_group.setStyleSheet(self.get_group_style())
+        engine_group.setStyleSheet(_GROUP_QSS)
+        self.engine_group = engine_group
         engine_layout = QVBoxLayout(engine_group)
         engine_layout.setContentsMargins(5, 15, 5, 5)
         engine_layout.setSpacing(5)
@@ -305,14 +684,14 @@ class MainWindow(QMainWindow):
         self.target_version_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)  # Prevent size changes
 
         self.target_version_combo = QComboBox()
-        self.target_version_combo.addItems(self.engine_paths.keys())
-        for i in range(self.target_version_combo.count()):
-            version_text = self.target_version_combo.itemText(i)
-            if version_text in self.engine_paths:
-                self.target_version_combo.setItemData(i, self.engine_paths[version_text], Qt.ToolTipRole)
+        self.populate_version_combo(self.engine_paths)
         self.target_version_combo.setMinimumWidth(120)
         self.target_version_combo.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)  # Prevent size changes
-        self.target_version_combo.currentIndexChanged.connect(self.check_version_match)
+        self._version_debounce = QTimer(self)
+        self._version_debounce.setSingleShot(True)
+        self._version_debounce.setInterval(50)
+        self._version_debounce.timeout.connect(self.check_version_match)
+        self.target_version_combo.currentIndexChanged.connect(lambda index: self._version_debounce.start())
 
         target_layout.addWidget(self.target_version_label)
         target_layout.addWidget(self.target_version_combo)
@@ -325,7 +704,8 @@ class MainWindow(QMainWindow):
 
         # Create Output Directory section
         output_group = QGroupBox(self.localize("output_group", "Output Directory"))
-        output_group.setStyleSheet(self.get_group_style())
+        output_group.setStyleSheet(_GROUP_QSS)
+        self.output_group = output_group
         output_layout = QVBoxLayout(output_group)
         output_layout.setContentsMargins(5, 15, 5, 5)
         output_layout.setSpacing(5)
@@ -385,13 +765,7 @@ class MainWindow(QMainWindow):
         console_frame = QFrame()
         console_frame.setFrameShape(QFrame.StyledPanel)
         console_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # Expand both ways
-        console_frame.setStyleSheet("""
-            QFrame {
-                background-color: #252526;
-                border: 1px solid #3F3F46;
-                border-radius: 3px;
-            }
-        """)
+        console_frame.setStyleSheet(_CONSOLE_QSS)
 
         console_layout = QVBoxLayout(console_frame)
         console_layout.setContentsMargins(5, 5, 5, 5)
@@ -426,23 +800,9 @@ class MainWindow(QMainWindow):
         self.show_command_button.clicked.connect(self.show_command)
 
         self.build_button = QPushButton(self.localize("build_button", "Build Plugin"))
-        self.build_button.clicked.connect(self.build_plugin)
-        self.build_button.setStyleSheet("""
-            QPushButton {
-                    background-color: #0078D4;
-                    color: white;
-                    padding: 6px 12px;
-                    font-weight: bold;
-                    border-radius: 4px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #106EBE;
-                }
-                QPushButton:pressed {
-                    background-color: #005A9E;
-                }
-        """)
+        # Connected once, the slot dispatches on the current button mode
+        self.build_button.clicked.connect(self._on_build_button_clicked)
+        self.build_button.setStyleSheet(_BUILD_BTN_QSS)
 
         bottom_layout.addWidget(self.advanced_button)
         bottom_layout.addWidget(self.help_button)
@@ -468,87 +828,108 @@ class MainWindow(QMainWindow):
         if self.localization:
             self.localization.language_changed.connect(self.update_ui_language)
 
+    def get_plugin_info(self, plugin_path: str) -> Optional[dict]:
+        """
+        Return information about a plugin, read again only when the file changes
+
+        :param plugin_path: Path to the .uplugin file
+        :return: Plugin information, or None if there is no such file or it cannot be read
+        """
+        if not plugin_path:
+            return None
+        try:
+            mtime_ns = os.stat(plugin_path).st_mtime_ns
+        except OSError:
+            return None
+
+        key = (plugin_path, mtime_ns)
+        if key in self._plugin_info_cache:
+            return self._plugin_info_cache[key]
+
+        if len(self._plugin_info_cache) >= 32:
+            self._plugin_info_cache.clear()
+        plugin_info = self.plugin_builder.extract_plugin_info(plugin_path, mtime_ns)
+        if plugin_info is not None:
+            # Parsed once here, compared on every target version change
+            plugin_info['_ver_tuple'] = version_tuple(plugin_info.get('engine_version') or "")
+        self._plugin_info_cache[key] = plugin_info
+        return plugin_info
+
     def check_version_match(self) -> None:
         """
         Check if plugin engine version matches target version and show warning if needed
         """
+        # Checked now, a pending debounced check is not needed
+        self._version_debounce.stop()
         plugin_path = self.plugin_path_edit.text()
-        if not plugin_path or not os.path.exists(plugin_path):
-            self.version_match_warning.hide()
-            return
-
-        # Get plugin info
-        plugin_info = self.plugin_builder.extract_plugin_info(plugin_path)
+        plugin_info = self.get_plugin_info(plugin_path)
         if not plugin_info or not plugin_info.get('is_engine_plugin') or not plugin_info.get('engine_version'):
             self.version_match_warning.hide()
             return
 
-        target_version = self.target_version_combo.currentText()
+        target_version = version_tuple(self.target_version_combo.currentText())
 
-        if plugin_info['engine_version'] in target_version or target_version in plugin_info['engine_version']:
+        if target_version and target_version == plugin_info['_ver_tuple']:
             self.version_match_warning.show()
         else:
             self.version_match_warning.hide()
 
-    def update_ui_language(self) -> None:
+    def update_ui_language(self, language_code: Optional[str] = None,
+                           translations: Optional[Dict[str, str]] = None) -> None:
         """
         Update UI elements after language change
+
+        :param language_code: New language code
+        :param translations: Translations of the new language, read directly during the update
         """
+        self._loc_cache.clear()
+
+        if translations is None:
+            localize = self.localize
+        else:
+            def localize(key: str, default: str) -> str:
+                return translations.get(key, default)
+
         # Update window title
-        self.setWindowTitle(self.localize("main_window_title", "UE Plugin Builder"))
+        self.setWindowTitle(localize("main_window_title", "UE Plugin Builder"))
 
         # Update group boxes
-        for widget in self.findChildren(QGroupBox):
-            if widget.objectName() == "engine_group":
-                widget.setTitle(self.localize("engine_group", "Unreal Engine"))
-            elif widget.objectName() == "plugin_group":
-                widget.setTitle(self.localize("plugin_group", "Plugin"))
-            elif widget.objectName() == "output_group":
-                widget.setTitle(self.localize("output_group", "Output Directory"))
+        self.plugin_group.setTitle(localize("plugin_group", "Plugin"))
+        self.engine_group.setTitle(localize("engine_group", "Unreal Engine"))
+        self.output_group.setTitle(localize("output_group", "Output Directory"))
 
         # Update labels
-        self.target_version_label.setText(self.localize("target_version_label", "Target UE Version:"))
+        self.target_version_label.setText(localize("target_version_label", "Target UE Version:"))
 
         # Update version match warning
-        self.version_match_warning.setText(self.localize("version_match_warning",
-                                                         "Warning: Target version matches plugin version!"))
+        self.version_match_warning.setText(localize("version_match_warning",
+                                                    "Warning: Target version matches plugin version!"))
+
+        # Update plugin info field labels
+        for field, key, default, _ in _PLUGIN_INFO_FIELDS:
+            self._plugin_info_rows[field][0].setText(localize(key, default))
 
         # Update empty plugin info text if no plugin selected
         if self.plugin_path_edit.text() == "":
-            self.plugin_info_text.setText(
-                self.localize("plugin_info_empty", "No information. Please select a plugin..."))
+            self.show_plugin_info_message(
+                localize("plugin_info_empty", "No information. Please select a plugin..."))
 
         # Update radio buttons
-        self.same_dir_radio.setText(self.localize("same_dir_radio", "To parent directory with UE version"))
-        self.other_dir_radio.setText(self.localize("other_dir_radio", "Select another directory"))
+        self.same_dir_radio.setText(localize("same_dir_radio", "To parent directory with UE version"))
+        self.other_dir_radio.setText(localize("other_dir_radio", "Select another directory"))
 
         # Update buttons
-        self.advanced_button.setText(self.localize("advanced_button", "Advanced Options"))
-        self.help_button.setText(self.localize("help_button", "BuildPlugin Help"))
-        self.clear_console_button.setText(self.localize("clear_console_button", "Clear Console"))
-        self.show_command_button.setText(self.localize("show_command_button", "Show Command"))
-        self.build_button.setText(self.localize("build_button", "Build Plugin"))
+        self.advanced_button.setText(localize("advanced_button", "Advanced Options"))
+        self.help_button.setText(localize("help_button", "BuildPlugin Help"))
+        self.clear_console_button.setText(localize("clear_console_button", "Clear Console"))
+        self.show_command_button.setText(localize("show_command_button", "Show Command"))
+        self.build_button.setText(localize("build_button", "Build Plugin"))
 
     def get_group_style(self) -> str:
         """
         Return style for QGroupBox
         """
-        return """
-            QGroupBox {
-                background-color: #2D2D30;
-                border: 1px solid #3F3F46;
-                border-radius: 3px;
-                margin-top: 1ex; /* Space for the title */
-                font-weight: bold;
-                padding: 3px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 3px;
-                color: #CCCCCC;
-            }
-        """
+        return _GROUP_QSS
 
     def apply_dark_theme(self) -> None:
         """
@@ -580,18 +961,8 @@ class MainWindow(QMainWindow):
         """
         self.console.append_text(self.localize("log_engines_search_start", "Starting Unreal Engine search..."), "INFO")
 
-        # Start search in a separate thread
-        import threading
-
-        def search_thread():
-            engines = self.engine_finder.find_all_engines()
-            # Update interface from main thread
-            QApplication.instance().postEvent(
-                self,
-                EnginesFoundEvent(engines)
-            )
-
-        threading.Thread(target=search_thread).start()
+        # Search on the thread pool, results arrive through engines_found
+        QThreadPool.globalInstance().start(_FindRunnable(self.engine_finder, False))
 
     def find_engines_forced(self) -> None:
         """
@@ -600,18 +971,42 @@ class MainWindow(QMainWindow):
         """
         self.console.append_text("Starting forced Unreal Engine search (ignoring configuration)...", "INFO")
 
-        # Start search in a separate thread
-        import threading
+        QThreadPool.globalInstance().start(_FindRunnable(self.engine_finder, True))
 
-        def search_thread_forced():
-            engines = self.engine_finder.find_all_engines(force_rescan=True)
-            # Update interface from main thread
-            QApplication.instance().postEvent(
-                self,
-                EnginesFoundEvent(engines)
-            )
+    def populate_version_combo(self, engines: Dict[str, str]) -> None:
+        """
+        Fill target version combo box with engine versions, newest first
 
-        threading.Thread(target=search_thread_forced).start()
+        Items are added in one batch without intermediate signals or repaints,
+        a single currentIndexChanged is emitted at the end. The combo box is
+        left untouched if the engines are the same as last time.
+
+        :param engines: Dictionary {version: engine path}, paths are shown as tooltips
+        """
+        # Nothing to do if the combo box already shows exactly these engines
+        engines_hash = hash(tuple(sorted(engines.items())))
+        if engines_hash == self._engines_hash:
+            return
+        self._engines_hash = engines_hash
+
+        combo = self.target_version_combo
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+
+        combo.clear()
+        sorted_versions = sorted(engines, key=version_tuple, reverse=True)
+        combo.addItems(sorted_versions)
+        for i, version in enumerate(sorted_versions):
+            combo.setItemData(i, engines[version], Qt.ToolTipRole)
+        # Engine path by combo box text, with the UE_ prefix stripped once here
+        self._combo_to_engine_path = {
+            version: engines.get(version[3:] if version.startswith("UE_") else version)
+            for version in sorted_versions
+        }
+
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
+        combo.currentIndexChanged.emit(combo.currentIndex())
 
     def update_engines_list(self, engines: Dict[str, str]) -> None:
         """
@@ -645,22 +1040,7 @@ class MainWindow(QMainWindow):
 
         self.engine_paths = engines
 
-        # Clear combo boxes
-        self.target_version_combo.clear()
-
-        # Add found versions with tooltips showing engine paths
-        for version in sorted(engines.keys(), reverse=True):
-            # Use UE_ prefix for display
-            display_text = version
-
-            # Add to target combobox with tooltip
-            self.target_version_combo.addItem(display_text)
-            self.target_version_combo.setItemData(self.target_version_combo.count() - 1, f"{engines[version]}",
-                                                  Qt.ToolTipRole)
-
-            # # If more than one version, select next for target
-            # if self.target_version_combo.count() > 1:
-            #     self.target_version_combo.setCurrentIndex(1)
+        self.populate_version_combo(engines)
 
     def browse_plugin(self) -> None:
         """
@@ -678,43 +1058,55 @@ class MainWindow(QMainWindow):
             self.update_plugin_info()
             self.update_output_path()
 
+    def show_plugin_info_message(self, message: str) -> None:
+        """
+        Show a message in place of the plugin information fields
+
+        :param message: Message text
+        """
+        self.plugin_info_text.setText(message)
+        self.plugin_info_text.show()
+        for field_label, value_label in self._plugin_info_rows.values():
+            field_label.hide()
+            value_label.hide()
+
+    def show_plugin_info(self, plugin_info: dict) -> None:
+        """
+        Show plugin information fields, rows of unset optional fields are hidden
+
+        :param plugin_info: Plugin information
+        """
+        self.plugin_info_text.hide()
+        for field, _, _, required in _PLUGIN_INFO_FIELDS:
+            field_label, value_label = self._plugin_info_rows[field]
+            visible = required is None or bool(plugin_info[required])
+            if visible:
+                value = plugin_info[field]
+                # QLabel.setText does nothing if the text is unchanged
+                value_label.setText(', '.join(value) if isinstance(value, list) else str(value))
+            field_label.setVisible(visible)
+            value_label.setVisible(visible)
+
     def update_plugin_info(self) -> None:
         """
         Update information about selected plugin
         """
+        # Updated now, e.g. after browsing or dropping, a pending debounced update is not needed
+        self._path_debounce.stop()
         plugin_path = self.plugin_path_edit.text()
 
         if not plugin_path or not os.path.exists(plugin_path):
-            self.plugin_info_text.setText(
-                self.localize("plugin_info_empty", "No information. Please select a plugin..."))
+            self.show_plugin_info_message(self.T.plugin_info_empty)
             self.version_match_warning.hide()  # Hide warning when no plugin
             return
 
-        plugin_info = self.plugin_builder.extract_plugin_info(plugin_path)
+        plugin_info = self.get_plugin_info(plugin_path)
 
         if plugin_info:
-            info_text = (
-                f"<b>{self.localize('plugin_info_name', 'Name:')}</b> {plugin_info['name']}<br>"
-                f"<b>{self.localize('plugin_info_version', 'Version:')}</b> {plugin_info['version']}<br>"
-                f"<b>{self.localize('plugin_info_category', 'Category:')}</b> {plugin_info['category']}<br>"
-                f"<b>{self.localize('plugin_info_description', 'Description:')}</b> {plugin_info['description']}<br>"
-                f"<b>{self.localize('plugin_info_modules', 'Modules:')}</b> {', '.join(plugin_info['modules'])}<br>"
-            )
-
-            if plugin_info['is_engine_plugin']:
-                info_text += f"<b>{self.localize('plugin_info_engine_version', 'Engine Version:')}</b> {plugin_info['engine_version']}<br>"
-
-            if plugin_info['marketplace_url']:
-                info_text += f"<b>{self.localize('plugin_info_marketplace_url', 'Marketplace URL:')}</b> {plugin_info['marketplace_url']}<br>"
-
-            if plugin_info['supported_platforms']:
-                info_text += f"<b>{self.localize('plugin_info_supported_platforms', 'Supported Platforms:')}</b> {', '.join(plugin_info['supported_platforms'])}"
-
-            self.plugin_info_text.setText(info_text)
-
+            self.show_plugin_info(plugin_info)
             self.check_version_match()
         else:
-            self.plugin_info_text.setText(self.localize("plugin_info_error", "Error reading plugin information."))
+            self.show_plugin_info_message(self.T.plugin_info_error)
             self.version_match_warning.hide()  # Hide warning on error
 
     def browse_output(self) -> None:
@@ -744,11 +1136,7 @@ class MainWindow(QMainWindow):
         """
         Return path to target UE version
         """
-        selected_version = self.target_version_combo.currentText()
-        # Strip UE_ prefix if present
-        if selected_version.startswith("UE_"):
-            selected_version = selected_version[3:]
-        return self.engine_paths.get(selected_version)
+        return self._combo_to_engine_path.get(self.target_version_combo.currentText())
 
     def get_output_path(self) -> str:
         """
@@ -759,47 +1147,61 @@ class MainWindow(QMainWindow):
         if not plugin_path:
             return ""
 
-        # Extract plugin name without extension
-        plugin_dir = os.path.dirname(plugin_path)
-        plugin_name = os.path.splitext(os.path.basename(plugin_path))[0]
-
         target_version = self.target_version_combo.currentText()
+        same_dir = self.same_dir_radio.isChecked()
+        custom_dir = "" if same_dir else self.output_path_edit.text()
 
-        if self.same_dir_radio.isChecked():
-            # Use parent directory instead of current directory
-            parent_dir = os.path.dirname(plugin_dir)
-
-            # Get plugin folder name
-            plugin_folder_name = os.path.basename(plugin_dir)
+        # Called several times in a row for the same inputs (command, build, result message)
+        key = (plugin_path, target_version, same_dir, custom_dir)
+        if key == self._output_path_key:
+            return self._output_path
 
-            # Extract base plugin name (without version if specified in folder name)
-            base_folder_name = plugin_folder_name.split('_')[0]
+        path = PurePath(plugin_path)
+        plugin_dir = path.parent
 
-            # Create new directory name with target version
-            new_folder_name = f"{base_folder_name}_{target_version}"
-
-            # Form full path
-            output_path = os.path.join(parent_dir, new_folder_name)
+        if same_dir:
+            # Use parent directory instead of current directory,
+            # base plugin name (without version if specified in folder name) with target version
+            output_path = plugin_dir.parent / f"{plugin_dir.name.split('_')[0]}_{target_version}"
 
             # Check if output path matches input path
-            if os.path.normpath(output_path) == os.path.normpath(plugin_dir):
+            if output_path == plugin_dir:
                 # If matches, add suffix
-                output_path = f"{output_path}_build"
+                output_path = output_path.with_name(f"{output_path.name}_build")
         else:
-            # Return user-selected directory with plugin name and version
-            custom_dir = self.output_path_edit.text()
-            output_path = os.path.join(custom_dir, f"{plugin_name}_{target_version}")
+            # Return user-selected directory with plugin name (without extension) and version
+            output_path = PurePath(custom_dir) / f"{path.stem}_{target_version}"
 
-        # Normalize path and replace backslashes with forward slashes
-        return os.path.normpath(output_path).replace("\\", "/")
+        # Path with forward slashes
+        self._output_path_key = key
+        self._output_path = output_path.as_posix()
+        return self._output_path
 
     def show_advanced_options(self) -> None:
         """
         Show dialog with advanced build options
         """
-        dialog = AdvancedOptionsDialog(self, self.localization)
+        # The dialog is created once and reused, and again only after a language change
+        loc_version = self.localization.loc_version if self.localization else 0
+        if self._adv_dialog is None or self._adv_dialog_version != loc_version:
+            if self._adv_dialog is not None:
+                self._adv_dialog.deleteLater()
+            self._adv_dialog = AdvancedOptionsDialog(self, self.localization)
+            self._adv_dialog_version = loc_version
+            if self._adv_options_accepted:
+                self._adv_dialog.set_build_options(self.advanced_options)
+
+        dialog = self._adv_dialog
         if dialog.exec():
             self.advanced_options = dialog.get_build_options()
+            self._adv_options_accepted = True
+        elif self._adv_options_accepted:
+            # Cancelled, discard the changes made in the dialog
+            dialog.set_build_options(self.advanced_options)
+        else:
+            # Cancelled before any options were accepted, the next opening starts from the defaults
+            dialog.deleteLater()
+            self._adv_dialog = None
 
     def show_build_plugin_help(self) -> None:
         """
@@ -810,7 +1212,7 @@ class MainWindow(QMainWindow):
         if not target_engine_path:
             QMessageBox.warning(
                 self,
-                self.localize("error_title", "Error"),
+                self.T.error_title,
                 self.localize("help_error_target", "Select target Unreal Engine version.")
             )
             return
@@ -819,14 +1221,14 @@ class MainWindow(QMainWindow):
         if not os.path.exists(uat_path):
             QMessageBox.warning(
                 self,
-                self.localize("error_title", "Error"),
+                self.T.error_title,
                 self.localize("help_error_uat", "RunUAT.bat file not found at path: {0}", **{"0": uat_path})
             )
             return
 
         # Start process to get help
         try:
-            help_msg = self.localize("help_start", "Getting BuildPlugin help...")
+            help_msg = self.T.help_start
             self.console.append_text(help_msg, "INFO")
             process = QProcess()
             process.finished.connect(lambda code, status: self.handle_help_finished(process, code))
@@ -841,11 +1243,11 @@ class MainWindow(QMainWindow):
         """
         if exit_code == 0:
             output = process.readAllStandardOutput().data().decode('utf-8', errors='replace')
-            self.console.append_text(self.localize("help_header", "=== BuildPlugin Help ==="), "INFO")
-            for line in output.splitlines():
-                if line.strip():
-                    self.console.append_text(line, "INFO")
-            self.console.append_text(self.localize("help_footer", "=== End of Help ==="), "INFO")
+            # Header, non-empty help lines and footer in one console batch
+            lines = [self.T.help_header]
+            lines.extend(line for line in output.splitlines() if line.strip())
+            lines.append(self.T.help_footer)
+            self.console.append_block("\n".join(lines), "INFO")
         else:
             error = process.readAllStandardError().data().decode('utf-8', errors='replace')
             error_msg = f"Error getting help (code: {exit_code})"
@@ -869,17 +1271,19 @@ class MainWindow(QMainWindow):
         if command:
             # Show dialog with command
             dialog = QDialog(self)
-            dialog.setWindowTitle(self.localize("command_dialog_title", "Build Command"))
+            dialog.setWindowTitle(self.T.command_dialog_title)
             dialog.setMinimumWidth(600)
 
             layout = QVBoxLayout(dialog)
 
-            command_label = QLabel(self.localize("command_label", "Command to run in command line:"))
+            command_label = QLabel(self.T.command_label)
             layout.addWidget(command_label)
 
-            command_text = QTextEdit()
-            command_text.setPlainText(command)
-            command_text.setReadOnly(True)
+            # Static text, a selectable label is enough to copy it
+            command_text = QLabel(command)
+            command_text.setTextFormat(Qt.PlainText)
+            command_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            command_text.setWordWrap(True)
             layout.addWidget(command_text)
 
             buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -891,7 +1295,7 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(
                 self,
-                self.localize("error_title", "Error"),
+                self.T.error_title,
                 self.localize("error_cannot_start_build", "Failed to form build command. Check all build parameters.")
             )
 
@@ -904,37 +1308,23 @@ class MainWindow(QMainWindow):
         output_path = self.get_output_path()
         target_engine_path = self.get_target_engine_path()
 
-        if not plugin_path:
-            QMessageBox.warning(
-                self,
-                self.localize("error_title", "Error"),
-                self.localize("error_no_plugin", "No plugin selected for build.")
-            )
-            return
-
-        if not os.path.exists(plugin_path):
-            QMessageBox.warning(
-                self,
-                self.localize("error_title", "Error"),
-                self.localize("error_plugin_not_found", "Plugin file not found: {0}", **{"0": plugin_path})
-            )
-            return
-
-        if not output_path:
-            QMessageBox.warning(
-                self,
-                self.localize("error_title", "Error"),
-                self.localize("error_no_output", "Output path not specified.")
-            )
-            return
-
-        if not target_engine_path:
-            QMessageBox.warning(
-                self,
-                self.localize("error_title", "Error"),
-                self.localize("error_no_target_engine", "Target Unreal Engine version not selected.")
-            )
-            return
+        # (failed check, message key, default message, message arguments), checked in order
+        checks = (
+            (lambda: not plugin_path,
+             "error_no_plugin", "No plugin selected for build.", None),
+            (lambda: not os.path.exists(plugin_path),
+             "error_plugin_not_found", "Plugin file not found: {0}", ("0", plugin_path)),
+            (lambda: not output_path,
+             "error_no_output", "Output path not specified.", None),
+            (lambda: not target_engine_path,
+             "error_no_target_engine", "Target Unreal Engine version not selected.", None),
+        )
+        for failed, key, default, argument in checks:
+            if failed():
+                # Message is localized only for the check that failed
+                kwargs = {argument[0]: argument[1]} if argument else {}
+                QMessageBox.warning(self, self.T.error_title, self.localize(key, default, **kwargs))
+                return
 
         # Start building
         success = self.plugin_builder.build_plugin(
@@ -947,7 +1337,7 @@ class MainWindow(QMainWindow):
         if not success:
             QMessageBox.warning(
                 self,
-                self.localize("error_title", "Error"),
+                self.T.error_title,
                 self.localize("error_cannot_start_build", "Failed to start plugin build. Check parameters and logs.")
             )
 
@@ -957,60 +1347,35 @@ class MainWindow(QMainWindow):
         """
         self.console.append_text(message, log_type)
 
+    def _on_build_button_clicked(self) -> None:
+        """
+        Build or abort, depending on the current build button mode
+        """
+        if self._current_button_mode == "abort":
+            self.cancel_build()
+        else:
+            self.build_plugin()
+
     def switch_build_button_state(self, mode: str = "build") -> None:
         """
         Switch the build button between build and abort modes
 
         :param mode: 'build' or 'abort'
         """
-        # Disconnect any existing connections first to avoid multiple connections
-        try:
-            self.build_button.clicked.disconnect()
-        except TypeError:
-            # No connections to disconnect
-            pass
+        if mode == self._current_button_mode:
+            # Already in this mode, e.g. build finished after it was cancelled
+            return
+        self._current_button_mode = mode
 
         if mode == "build":
             # Set to build mode (blue button)
-            self.build_button.setText(self.localize("build_button", "Rebuild Plugin"))
-            self.build_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #0078D4;
-                    color: white;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    border-radius: 4px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #106EBE;
-                }
-                QPushButton:pressed {
-                    background-color: #005A9E;
-                }
-            """)
-            self.build_button.clicked.connect(self.build_plugin)
+            self.build_button.setText(self.T.build_button)
+            self.build_button.setStyleSheet(_BUILD_BTN_QSS)
 
         elif mode == "abort":
             # Set to abort mode (red button)
-            self.build_button.setText(self.localize("abort_button", "Abort Build"))
-            self.build_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #D13438;
-                    color: white;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    border-radius: 4px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #C50F1F;
-                }
-                QPushButton:pressed {
-                    background-color: #A80000;
-                }
-            """)
-            self.build_button.clicked.connect(self.cancel_build)
+            self.build_button.setText(self.T.abort_button)
+            self.build_button.setStyleSheet(_ABORT_BUTTON_QSS)
 
     def handle_build_started(self) -> None:
         """
@@ -1020,7 +1385,7 @@ class MainWindow(QMainWindow):
         self.switch_build_button_state("abort")
 
         # Log the build start
-        self.console.append_text(self.localize("log_build_start", "Starting plugin build..."), "INFO")
+        self.console.append_text(self.T.log_build_start, "INFO")
 
     def cancel_build(self) -> None:
         """
@@ -1029,8 +1394,8 @@ class MainWindow(QMainWindow):
         # Add confirmation dialog
         confirm = QMessageBox.question(
             self,
-            self.localize("cancel_build_title", "Cancel Build?"),
-            self.localize("cancel_build_message", "Are you sure you want to cancel the current build?"),
+            self.T.cancel_build_title,
+            self.T.cancel_build_message,
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No  # Default to No to prevent accidental cancellations
         )
@@ -1038,7 +1403,7 @@ class MainWindow(QMainWindow):
         if confirm == QMessageBox.Yes:
             if self.plugin_builder.cancel_build():
                 # Log the cancellation
-                cancelled_msg = self.localize("build_cancelled", "Build cancelled by user")
+                cancelled_msg = self.T.build_cancelled
                 self.console.append_text(cancelled_msg, "WARNING")
 
                 # Switch button back to build mode
@@ -1046,7 +1411,7 @@ class MainWindow(QMainWindow):
             else:
                 # If cancellation failed (no active process)
                 self.console.append_text(
-                    self.localize("cancel_failed", "No active build process to cancel."),
+                    self.T.cancel_failed,
                     "WARNING"
                 )
 
@@ -1064,32 +1429,7 @@ class MainWindow(QMainWindow):
         if success:
             QMessageBox.information(
                 self,
-                self.localize("build_success_title", "Build Complete"),
+                self.T.build_success_title,
                 self.localize("build_success_message", "Plugin successfully built to: {0}",
                               **{"0": self.get_output_path()})
             )
-
-
-class EnginesFoundEvent(QEvent):
-    """
-    Custom event for updating engine list in main thread
-    """
-    EVENT_TYPE = QEvent.Type(QEvent.registerEventType())
-
-    def __init__(self, engines: dict[str,str]):
-        super().__init__(self.EVENT_TYPE)
-        self.engines = engines
-
-    def get_engines(self) -> Dict[str, str]:
-        return self.engines
-
-
-# Override event method to handle custom events
-def event(self, e: QEvent) -> bool:
-    if e.type() == EnginesFoundEvent.EVENT_TYPE:
-        self.update_engines_list(e.get_engines())
-        return True
-    return super(MainWindow, self).event(e)
-
-
-MainWindow.event = event
\ No newline at end of file
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from source.backend.engine_finder import EngineFinder
+from source.backend.engine_finder import EngineFinder, version_tuple
 from source.frontend.localization import LocalizationManager
 
 
@@ -27,6 +27,7 @@ class ManualEngineEntryDialog(QDialog):
 
         # Initialize with existing engines if provided
         self.engines_list = existing_engines.copy() if existing_engines else {}
+        self._items_by_version: Dict[str, QListWidgetItem] = {}
 
         self.setWindowTitle(self.localize("manual_engines_title", "Add Unreal Engine Installations"))
         self.setMinimumSize(600, 400)
@@ -41,13 +42,29 @@ class ManualEngineEntryDialog(QDialog):
             return self.localization(key, default, **kwargs)
         return default if default is not None else key
 
+    @staticmethod
+    def create_engine_item(version: str, path: str) -> QListWidgetItem:
+        """Create list item for an engine"""
+        item = QListWidgetItem(f"{version} - {path}")
+        item.setData(Qt.UserRole, version)  # Store version as item data
+        return item
+
     def populate_engines_list(self) -> None:
         """Populate the list widget with existing engines"""
-        for version, path in self.engines_list.items():
-            item_text = f"{version} - {path}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, version)  # Store version as item data
-            self.list_widget.addItem(item)
+        items = [self.create_engine_item(version, path) for version, path in sorted(
+            self.engines_list.items(), key=lambda item: version_tuple(item[0]))]
+        # List item of each version, so versions added again update their item instead of duplicating it
+        self._items_by_version = {item.data(Qt.UserRole): item for item in items}
+
+        # Add all items without intermediate signals or repaints
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            for item in items:
+                self.list_widget.addItem(item)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
 
         # Enable save button if we have engines
         self.save_button.setEnabled(len(self.engines_list) > 0)
@@ -186,10 +203,13 @@ class ManualEngineEntryDialog(QDialog):
 
         # Add to our dictionary and list widget
         self.engines_list[version] = path
-        item_text = f"{version} - {path}"
-        item = QListWidgetItem(item_text)
-        item.setData(Qt.UserRole, version)  # Store version as item data
-        self.list_widget.addItem(item)
+        item = self._items_by_version.get(version)
+        if item is None:
+            item = self.create_engine_item(version, path)
+            self._items_by_version[version] = item
+            self.list_widget.addItem(item)
+        else:
+            item.setText(f"{version} - {path}")
 
         # Clear form
         self.version_edit.clear()
@@ -203,10 +223,11 @@ class ManualEngineEntryDialog(QDialog):
         current_item = self.list_widget.currentItem()
         if current_item:
             version = current_item.data(Qt.UserRole)
-            if version in self.engines_list:
-                del self.engines_list[version]
+            self.engines_list.pop(version, None)
+            self._items_by_version.pop(version, None)
 
-            self.list_widget.takeItem(self.list_widget.row(current_item))
+            # Row of the current item is known, no need to search for it
+            self.list_widget.takeItem(self.list_widget.currentRow())
 
             # Disable save button if no engines left
             self.save_button.setEnabled(len(self.engines_list) > 0)